@@ -10,12 +10,16 @@ import logging
 from typing import Optional, Dict, Any, List
 import cv2
 import numpy as np
-from PIL import Image
-import io
 
 class OllamaClient:
     """Client for interacting with Ollama vision models."""
     
+    # Longest image side sent to the model; vision models downscale to about this anyway
+    MAX_IMAGE_SIDE = 768
+    
+    # JPEG quality of the uploaded image
+    JPEG_QUALITY = 85
+    
     def __init__(self, base_url: str = "http://localhost:11434"):
         """Initialize Ollama client."""
         self.base_url = base_url
@@ -76,26 +80,42 @@ class OllamaClient:
             self.logger.error(f"Model {model_name} not available")
             return False
     
-    def image_to_base64(self, image: np.ndarray) -> str:
-        """Convert OpenCV image to base64 string."""
-        # Convert BGR to RGB
-        if len(image.shape) == 3:
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        else:
-            image_rgb = image
+    def load_model(self) -> bool:
+        """Ask Ollama to load the selected model into memory ahead of the first analysis."""
+        if not self.is_available or not self.selected_model:
+            return False
         
-        # Convert to PIL Image
-        pil_image = Image.fromarray(image_rgb)
+        try:
+            # A generate request without a prompt only loads the model
+            response = requests.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.selected_model},
+                timeout=60  # Loading a vision model can be slow
+            )
+            return response.status_code == 200
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"Could not preload model {self.selected_model}: {e}")
+            return False
+    
+    def image_to_base64(self, image: np.ndarray) -> str:
+        """Convert OpenCV image to a downscaled base64 JPEG string."""
+        # Shrink large images so the upload and model preprocessing stay small
+        height, width = image.shape[:2]
+        scale = self.MAX_IMAGE_SIDE / max(height, width)
+        if scale < 1:
+            image = cv2.resize(image, (int(width * scale), int(height * scale)),
+                               interpolation=cv2.INTER_AREA)
         
-        # Convert to base64
-        buffer = io.BytesIO()
-        pil_image.save(buffer, format='JPEG', quality=85)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        # OpenCV encodes BGR (or grayscale) images directly
+        ok, buffer = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY])
+        if not ok:
+            raise ValueError("Could not encode image as JPEG")
         
-        return image_base64
+        return base64.b64encode(buffer.tobytes()).decode('utf-8')
     
-    def analyze_card_image(self, image: np.ndarray, prompt: str = None) -> Optional[Dict[str, Any]]:
-        """Analyze a Magic card image using the selected vision model."""
+    def analyze_card_image(self, image: np.ndarray, prompt: str = None,
+                           options: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Analyze a Magic card image using the selected vision model, with optional Ollama model options."""
         if not self.is_available:
             self.logger.error("Ollama not available")
             return None
@@ -133,6 +153,8 @@ Focus on the card name accuracy. If you can't read something clearly, indicate u
                 "images": [image_b64],
                 "stream": False
             }
+            if options:
+                data["options"] = options
             
             self.logger.info(f"Sending card image to {self.selected_model}")
             
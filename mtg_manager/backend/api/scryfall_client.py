@@ -13,6 +13,16 @@ import threading
 from typing import Callable, Optional, Dict, List, Any
 from urllib.parse import quote
 
+# Bit per color in a card's color mask (see color_mask)
+COLOR_BITS = {'W': 1, 'U': 2, 'B': 4, 'R': 8, 'G': 16}
+
+def color_mask(colors) -> int:
+    """Fold color codes (a list like ['W', 'U'] or a string like 'WU') into a WUBRG bitmask."""
+    mask = 0
+    for color in colors or ():
+        mask |= COLOR_BITS.get(color, 0)
+    return mask
+
 class ScryfallClientSingleton:
     """Singleton wrapper for ScryfallClient to ensure only one instance exists."""
     _instance = None
@@ -54,6 +64,7 @@ class ScryfallClient:
     def _load_cache(self):
         """Load cached card data from local files."""
         self.card_cache = {}
+        self._invalidate_indexes()
         cache_file = os.path.join(self.cache_dir, "cards_cache.json")
         
         if os.path.exists(cache_file):
@@ -116,6 +127,7 @@ class ScryfallClient:
         if result:
             # Cache the result
             self.card_cache[cache_key] = result
+            self._invalidate_indexes()
             self._save_cache()
         
         return result
@@ -323,6 +335,8 @@ class ScryfallClient:
                 if progress_callback:
                     progress_callback(total_cards, total_cards)
                 
+                self._invalidate_indexes()
+                
                 # Save updated cache
                 self._save_cache()
                 
@@ -343,6 +357,47 @@ class ScryfallClient:
         cache_key = f"name:{name.lower()}"
         return self.card_cache.get(cache_key)
     
+    def _invalidate_indexes(self):
+        """Drop lookup structures derived from the card cache; they are rebuilt on demand."""
+        self._name_set = None
+        self._search_index = None
+    
+    def get_search_index(self) -> Dict[str, list]:
+        """
+        Get a column-wise view of the cached cards for searching and filtering.
+        
+        Each list is parallel to 'cards': lowercased names, WUBRG color bitmasks,
+        converted mana costs and lowercased type lines. 'trigrams' maps every
+        three-character substring of a name to the ascending positions of the
+        names containing it. Rebuilt only after the cache changes.
+        """
+        index = self._search_index
+        if index is None:
+            cards = [card for key, card in self.card_cache.items() if key.startswith('name:')]
+            names = [card.get('name', '').lower() for card in cards]
+            
+            trigrams = {}
+            for i, name in enumerate(names):
+                for gram in {name[j:j + 3] for j in range(len(name) - 2)}:
+                    trigrams.setdefault(gram, []).append(i)
+            
+            index = {
+                'cards': cards,
+                'names': names,
+                'colors': [color_mask(card.get('colors')) for card in cards],
+                'cmc': [card.get('cmc') or 0 for card in cards],
+                'types': [(card.get('type_line') or '').lower() for card in cards],
+                'trigrams': trigrams,
+            }
+            self._search_index = index
+        return index
+    
+    def get_name_set(self) -> frozenset:
+        """Get the lowercased names of all cached cards, rebuilt only after the cache changes."""
+        if self._name_set is None:
+            self._name_set = frozenset(key[5:] for key in self.card_cache if key.startswith('name:'))
+        return self._name_set
+    
     def get_cached_card_by_id(self, card_id: str) -> Optional[Dict[str, Any]]:
         """Get a card from cache by ID."""
         cache_key = f"id:{card_id}"
@@ -358,28 +413,72 @@ class ScryfallClient:
         cache_key = f"print:{set_code}:{collector_number}"
         return self.card_cache.get(cache_key)
     
-    def search_cards_in_cache(self, query: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Search for cards in the local cache using simple text matching."""
+    def search_cards_in_cache(self, query: str, limit: int = 100,
+                              filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Search for cards in the local cache using simple text matching.
+        
+        Args:
+            query: Text to find in card names (case-insensitive)
+            limit: Maximum number of results
+            filters: Optional filters applied before the limit:
+                - colors: Color codes, e.g. 'WU'; matches cards with any of them
+                - type_line: Text the type line must contain (case-insensitive)
+                - cmc: Exact converted mana cost
+                - min_cmc: Minimum converted mana cost
+        """
         results = []
         query_lower = query.lower()
-        
-        # Search through cached cards
-        for cache_key, card_data in self.card_cache.items():
-            if not cache_key.startswith('name:'):
+        filters = filters or {}
+        
+        wanted_colors = color_mask(filters.get('colors'))
+        type_text = (filters.get('type_line') or '').lower()
+        exact_cmc = filters.get('cmc')
+        min_cmc = filters.get('min_cmc')
+        
+        # Scan the index columns instead of the card dicts
+        index = self.get_search_index()
+        cards = index['cards']
+        card_names = index['names']
+        card_colors = index['colors']
+        card_cmc = index['cmc']
+        card_types = index['types']
+        
+        # Every match contains each trigram of the query, so only the names
+        # listed under the query's rarest trigram need checking, and a
+        # trigram no name contains means there is nothing to find
+        if len(query_lower) >= 3:
+            trigrams = index['trigrams']
+            candidates = None
+            for j in range(len(query_lower) - 2):
+                postings = trigrams.get(query_lower[j:j + 3])
+                if not postings:
+                    return []
+                if candidates is None or len(postings) < len(candidates):
+                    candidates = postings
+        else:
+            candidates = range(len(card_names))
+        
+        for i in candidates:
+            if query_lower not in card_names[i]:
                 continue
-                
-            # Skip if we already have enough results
+            if wanted_colors and not card_colors[i] & wanted_colors:
+                continue
+            if type_text and type_text not in card_types[i]:
+                continue
+            if exact_cmc is not None and card_cmc[i] != exact_cmc:
+                continue
+            if min_cmc is not None and card_cmc[i] < min_cmc:
+                continue
+            
+            results.append(i)
             if len(results) >= limit:
                 break
-            
-            # Check if query matches card name
-            card_name = card_data.get('name', '').lower()
-            if query_lower in card_name:
-                results.append(card_data)
-        
-        # Sort results by relevance (exact matches first, then partial matches)
-        def sort_key(card):
-            name = card.get('name', '').lower()
+        
+        # Sort results by relevance (exact matches first, then partial matches),
+        # reading the lowercased names column rather than each card dict
+        def sort_key(i):
+            name = card_names[i]
             if name == query_lower:
                 return 0  # Exact match
             elif name.startswith(query_lower):
@@ -388,7 +487,48 @@ class ScryfallClient:
                 return 2  # Contains query
         
         results.sort(key=sort_key)
-        return results
+        return [cards[i] for i in results]
+    
+    def search_cards_prioritized(self, name: str, set_code: str = '', collector_number: str = '',
+                                 limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search the local cache for a card name, best matches first, in one pass.
+        
+        Args:
+            name: Card name, or part of one (case-insensitive)
+            set_code: Preferred set code, if known
+            collector_number: Preferred collector number, if known
+            limit: Maximum number of results
+            
+        Returns:
+            Exact name matches, then names starting with the name, then names
+            containing it; within each group the given set and collector
+            number come first
+        """
+        if not name:
+            return []
+        
+        name_lower = name.lower()
+        set_lower = (set_code or '').lower()
+        number = str(collector_number or '')
+        
+        # Rank every containing name, not just the first few in index order
+        matches = self.search_cards_in_cache(name, limit=len(self.get_search_index()['cards']))
+        
+        def rank(card):
+            card_name = card.get('name', '').lower()
+            if card_name == name_lower:
+                name_rank = 0
+            elif card_name.startswith(name_lower):
+                name_rank = 1
+            else:
+                name_rank = 2
+            return (name_rank,
+                    bool(set_lower) and card.get('set', '').lower() != set_lower,
+                    bool(number) and str(card.get('collector_number', '')) != number)
+        
+        matches.sort(key=rank)
+        return matches[:limit]
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the current cache."""
@@ -415,6 +555,7 @@ class ScryfallClient:
         """Clear the local cache."""
         try:
             self.card_cache = {}
+            self._invalidate_indexes()
             cache_file = os.path.join(self.cache_dir, "cards_cache.json")
             if os.path.exists(cache_file):
                 os.remove(cache_file)
@@ -426,11 +567,14 @@ class ScryfallClient:
     
     @classmethod
     def get_instance(cls, cache_dir: str = "assets/cache"):
-        """Get or create a singleton instance of ScryfallClient."""
-        if not hasattr(cls, '_singleton_instance') or cls._singleton_instance is None:
-            cls._singleton_instance = cls(cache_dir)
-            logging.getLogger(__name__).info("Created new ScryfallClient singleton instance")
+        """Get or create a singleton instance of ScryfallClient; callers wait while another thread creates it."""
+        if cls._singleton_instance is None:
+            with cls._singleton_lock:
+                if cls._singleton_instance is None:
+                    cls._singleton_instance = cls(cache_dir)
+                    logging.getLogger(__name__).info("Created new ScryfallClient singleton instance")
         return cls._singleton_instance
     
-    # Class variable to store singleton
-    _singleton_instance = None
\ No newline at end of file
+    # Class variables to store the singleton and guard its creation
+    _singleton_instance = None
+    _singleton_lock = threading.Lock()
\ No newline at end of file
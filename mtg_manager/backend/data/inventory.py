@@ -3,8 +3,9 @@
 Inventory management for MTG Collection Manager.
 """
 
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from backend.utils.db import DatabaseManager
 from backend.data.models import Collection, Card, InventoryItem
 from backend.api.scryfall_client import ScryfallClient
@@ -15,10 +16,18 @@ class InventoryManager:
     def __init__(self, db_manager: DatabaseManager = None, scryfall_client: ScryfallClient = None):
         """Initialize inventory manager."""
         self.db_manager = db_manager or DatabaseManager()
-        # Use provided client or get singleton instance
-        self.scryfall_client = scryfall_client or ScryfallClient.get_instance()
+        # Use provided client or get singleton instance on first use, so the
+        # database-only methods never wait for the card cache to load
+        self._scryfall_client = scryfall_client
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def scryfall_client(self) -> ScryfallClient:
+        """Scryfall client, resolving the shared singleton on first use."""
+        if self._scryfall_client is None:
+            self._scryfall_client = ScryfallClient.get_instance()
+        return self._scryfall_client
+    
     def get_collections(self) -> List[Collection]:
         """Get all collections."""
         rows = self.db_manager.execute_query("SELECT * FROM collections ORDER BY name")
@@ -310,6 +319,36 @@ class InventoryManager:
             self.logger.error(f"Failed to get inventory item {item_id}: {e}")
             return None
 
+    def get_unreferenced_image_files(self, file_names: Iterable[str]) -> List[str]:
+        """
+        Return the cached image file names whose URL no card in any collection uses.
+
+        Cache files are named '<md5 of image URL>_<size>.png', so the file names are
+        loaded into a temporary table and anti-joined against the hashed card URLs.
+        """
+        conn = self.db_manager.get_connection()
+        try:
+            conn.create_function("md5", 1,
+                                 lambda text: hashlib.md5(text.encode()).hexdigest(),
+                                 deterministic=True)
+            conn.execute("CREATE TEMP TABLE cache_files (name TEXT PRIMARY KEY, url_hash TEXT)")
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache_files VALUES (?, ?)",
+                ((name, name.split('_', 1)[0]) for name in file_names)
+            )
+            rows = conn.execute(
+                """SELECT name FROM cache_files
+                   WHERE url_hash NOT IN (
+                       SELECT md5(image_url) FROM (
+                           SELECT DISTINCT c.image_url
+                           FROM inventory i
+                           JOIN cards c ON i.card_id = c.id
+                           WHERE c.image_url IS NOT NULL AND c.image_url != ''))"""
+            ).fetchall()
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
+
     def remove_from_inventory(self, item_id: int) -> bool:
         """Remove an item from inventory."""
         return self.db_manager.execute_update(
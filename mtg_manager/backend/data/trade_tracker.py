@@ -5,7 +5,7 @@ Enhanced trade tracking functionality for MTG Collection Manager.
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from backend.utils.db import DatabaseManager
 from backend.data.models import Trade
 
@@ -16,6 +16,9 @@ class TradeTracker:
         """Initialize trade tracker."""
         self.db_manager = db_manager or DatabaseManager()
         self.logger = logging.getLogger(__name__)
+        # Per-collection trade statistics and the partners counted in them,
+        # kept up to date on add and dropped on delete
+        self._stats_cache: Dict[int, Tuple[Dict[str, Any], Set[str]]] = {}
     
     def add_trade_transaction(self, collection_id: int, trade_data: Dict[str, Any]) -> int:
         """
@@ -69,21 +72,39 @@ class TradeTracker:
                     transaction_id
                 )
             
+            if (cards_out or cards_in) and collection_id in self._stats_cache:
+                self._stats_cache[collection_id][0]['total_transactions'] += 1
+            
             self.logger.info(f"Added trade transaction {transaction_id} with {len(cards_out)} out, {len(cards_in)} in")
             return transaction_id
             
         except Exception as e:
+            self._stats_cache.pop(collection_id, None)
             self.logger.error(f"Failed to add trade transaction: {e}")
             raise e
     
     def add_trade(self, collection_id: int, card_id: int, quantity: int,
                   partner: str = None, note: str = None, transaction_id: int = None) -> int:
         """Add a single trade record."""
-        return self.db_manager.get_last_insert_id(
+        trade_id = self.db_manager.get_last_insert_id(
             """INSERT INTO trades (collection_id, card_id, quantity, partner, note, transaction_id)
                VALUES (?, ?, ?, ?, ?, ?)""",
             (collection_id, card_id, quantity, partner, note, transaction_id)
         )
+        
+        cached = self._stats_cache.get(collection_id)
+        if cached:
+            stats, partners = cached
+            stats['total_trade_records'] += 1
+            if quantity > 0:
+                stats['total_cards_received'] += quantity
+            else:
+                stats['total_cards_given'] -= quantity
+            if partner is not None:
+                partners.add(partner)
+                stats['unique_partners'] = len(partners)
+        
+        return trade_id
     
     def get_trades(self, collection_id: int, 
                    start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
@@ -110,25 +131,55 @@ class TradeTracker:
         rows = self.db_manager.execute_query(query, tuple(params))
         return [dict(row) for row in rows]
     
-    def get_trade_transactions(self, collection_id: int) -> List[Dict[str, Any]]:
-        """Get grouped trade transactions."""
+    def get_trades_for_transaction(self, transaction_id: int) -> List[Dict[str, Any]]:
+        """Get the trade records of a single transaction."""
+        query = """
+            SELECT t.id, t.quantity, t.date, t.partner, t.note, t.transaction_id,
+                   c.name as card_name, c.set_code, c.collector_number
+            FROM trades t
+            JOIN cards c ON t.card_id = c.id
+            WHERE t.transaction_id = ?
+            ORDER BY t.id
+        """
+        
+        rows = self.db_manager.execute_query(query, (transaction_id,))
+        return [dict(row) for row in rows]
+    
+    def get_trade_transactions(self, collection_id: int,
+                               since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get grouped trade transactions, optionally only those dated at or after since, shaped for display."""
         query = """
-            SELECT tt.id, tt.partner, tt.note, tt.date,
+            SELECT tt.id, COALESCE(tt.partner, 'Unknown') as partner,
+                   COALESCE(tt.note, '') as note, COALESCE(substr(tt.date, 1, 10), '') as date,
                    COUNT(t.id) as total_cards,
-                   SUM(CASE WHEN t.quantity > 0 THEN t.quantity ELSE 0 END) as cards_in,
-                   SUM(CASE WHEN t.quantity < 0 THEN ABS(t.quantity) ELSE 0 END) as cards_out
+                   COALESCE(SUM(CASE WHEN t.quantity > 0 THEN t.quantity ELSE 0 END), 0) as cards_in,
+                   COALESCE(SUM(CASE WHEN t.quantity < 0 THEN ABS(t.quantity) ELSE 0 END), 0) as cards_out
             FROM trade_transactions tt
             LEFT JOIN trades t ON tt.id = t.transaction_id
             WHERE tt.collection_id = ?
+        """
+        params = [collection_id]
+        
+        if since:
+            # Dates are stored both as 'YYYY-MM-DD HH:MM:SS' and ISO 'T' strings,
+            # so compare them normalized rather than as text
+            query += " AND datetime(tt.date) >= datetime(?)"
+            params.append(since.isoformat(sep=' ', timespec='seconds'))
+        
+        query += """
             GROUP BY tt.id, tt.partner, tt.note, tt.date
             ORDER BY tt.date DESC
         """
         
-        rows = self.db_manager.execute_query(query, (collection_id,))
+        rows = self.db_manager.execute_query(query, tuple(params))
         return [dict(row) for row in rows]
     
     def get_trade_stats(self, collection_id: int) -> Dict[str, Any]:
-        """Get trade statistics for a collection."""
+        """Get trade statistics for a collection, computed once and then kept up to date."""
+        cached = self._stats_cache.get(collection_id)
+        if cached:
+            return dict(cached[0])
+        
         query = """
             SELECT 
                 COUNT(DISTINCT transaction_id) as total_transactions,
@@ -141,19 +192,32 @@ class TradeTracker:
         """
         
         result = self.db_manager.execute_query(query, (collection_id,))
-        if result:
-            return dict(result[0])
-        
-        return {
+        stats = {
             'total_transactions': 0,
             'total_trade_records': 0,
             'total_cards_received': 0,
             'total_cards_given': 0,
             'unique_partners': 0
         }
+        if result:
+            # SUM is NULL when there are no trades
+            stats.update({key: value or 0 for key, value in dict(result[0]).items()})
+        
+        rows = self.db_manager.execute_query(
+            "SELECT DISTINCT partner FROM trades WHERE collection_id = ? AND partner IS NOT NULL",
+            (collection_id,)
+        )
+        self._stats_cache[collection_id] = (stats, {row['partner'] for row in rows})
+        return dict(stats)
+    
+    def clear_stats_cache(self):
+        """Drop cached trade statistics, e.g. after the database is replaced."""
+        self._stats_cache.clear()
     
     def delete_trade_transaction(self, transaction_id: int) -> bool:
         """Delete an entire trade transaction and all its records."""
+        # Only the transaction ID is known here, so drop every collection's stats
+        self._stats_cache.clear()
         try:
             # Delete individual trade records
             self.db_manager.execute_update(
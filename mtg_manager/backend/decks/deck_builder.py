@@ -4,7 +4,7 @@ Deck building functionality for MTG Collection Manager.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from backend.utils.db import DatabaseManager
 from backend.data.models import Deck, DeckCard, Card
 from backend.data.inventory import InventoryManager
@@ -403,4 +403,34 @@ class DeckBuilder:
             
         except Exception as e:
             self.logger.error(f"Failed to get deck {deck_id}: {e}")
+            return None
+    
+    def get_deck_overview(self, deck_id: int) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Get deck information and statistics (as get_deck_by_id and get_deck_stats) in one query."""
+        query = """
+            SELECT d.*,
+                SUM(dc.quantity) as total_cards,
+                COUNT(DISTINCT c.id) as unique_cards,
+                AVG(c.cmc) as avg_cmc,
+                SUM(CASE WHEN dc.is_sideboard = 0 AND dc.is_commander = 0 THEN dc.quantity ELSE 0 END) as main_deck_count
+            FROM decks d
+            LEFT JOIN deck_cards dc ON dc.deck_id = d.id
+            LEFT JOIN cards c ON dc.card_id = c.id
+            WHERE d.id = ?
+            GROUP BY d.id
+        """
+        
+        try:
+            rows = self.db_manager.execute_query(query, (deck_id,))
+            if not rows:
+                return None
+            
+            deck = dict(rows[0])
+            # Split off the statistics, converting None values to 0
+            stats = {key: deck.pop(key) or 0
+                     for key in ('total_cards', 'unique_cards', 'avg_cmc', 'main_deck_count')}
+            return deck, stats
+            
+        except Exception as e:
+            self.logger.error(f"Failed to get deck overview {deck_id}: {e}")
             return None
\ No newline at end of file
@@ -9,7 +9,7 @@ import sqlite3
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from backend.utils.db import DatabaseManager
 
 class BackupManager:
@@ -20,15 +20,20 @@ class BackupManager:
         self.db_manager = db_manager or DatabaseManager()
         self.logger = logging.getLogger(__name__)
     
-    def create_backup(self, backup_path: str, include_images: bool = False) -> bool:
+    # Pages copied per step of the sqlite online backup
+    BACKUP_PAGES_PER_STEP = 1024
+    
+    def create_backup(self, backup_path: str, include_images: bool = False,
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """Create a complete backup of the database and optionally images."""
         try:
             # Create backup directory
             backup_dir = os.path.dirname(backup_path)
-            os.makedirs(backup_dir, exist_ok=True)
+            if backup_dir:
+                os.makedirs(backup_dir, exist_ok=True)
             
-            # Copy database file
-            shutil.copy2(self.db_manager.db_path, backup_path)
+            # Online backup: copies only live pages and is consistent under concurrent writes
+            self._copy_database(self.db_manager.db_path, backup_path, progress_callback)
             
             # Optionally backup card images
             if include_images:
@@ -44,7 +49,8 @@ class BackupManager:
             self.logger.error(f"Backup failed: {e}")
             return False
     
-    def restore_backup(self, backup_path: str) -> bool:
+    def restore_backup(self, backup_path: str,
+                       progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
         """Restore database from backup."""
         try:
             if not os.path.exists(backup_path):
@@ -53,10 +59,11 @@ class BackupManager:
             
             # Create backup of current database
             current_backup = f"{self.db_manager.db_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            shutil.copy2(self.db_manager.db_path, current_backup)
+            self._copy_database(self.db_manager.db_path, current_backup)
             
-            # Restore from backup
-            shutil.copy2(backup_path, self.db_manager.db_path)
+            # Restore from backup into the live database, so open connections
+            # and the write-ahead log stay consistent
+            self._copy_database(backup_path, self.db_manager.db_path, progress_callback)
             
             # Verify restored database
             with self.db_manager.get_connection() as conn:
@@ -71,6 +78,21 @@ class BackupManager:
             self.logger.error(f"Restore failed: {e}")
             return False
     
+    def _copy_database(self, source_path: str, target_path: str,
+                       progress_callback: Optional[Callable[[int, int], None]] = None):
+        """Copy one SQLite database into another with the online backup API."""
+        progress = None
+        if progress_callback:
+            progress = lambda status, remaining, total: progress_callback(total - remaining, total)
+        
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=self.BACKUP_PAGES_PER_STEP, progress=progress)
+        finally:
+            target.close()
+            source.close()
+    
     def export_to_json(self, export_path: str) -> bool:
         """Export all data to JSON format."""
         try:
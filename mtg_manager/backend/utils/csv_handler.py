@@ -6,7 +6,8 @@ CSV import/export functionality for MTG Collection Manager.
 import csv
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import Callable, List, Dict, Any, Optional
 from backend.utils.db import DatabaseManager
 from backend.data.inventory import InventoryManager
 from backend.api.scryfall_client import ScryfallClient
@@ -14,6 +15,9 @@ from backend.api.scryfall_client import ScryfallClient
 class CSVHandler:
     """Handles CSV import and export operations."""
     
+    IMPORT_CHUNK_SIZE = 10_000  # Rows read and written per batch during import
+    VALID_CONDITIONS = ['Mint', 'Near Mint', 'Lightly Played', 'Moderately Played', 'Heavily Played', 'Damaged']
+    
     def __init__(self, db_manager: DatabaseManager = None, scryfall_client: ScryfallClient = None):
         """Initialize CSV handler with optional shared instances."""
         self.db_manager = db_manager or DatabaseManager()
@@ -84,8 +88,15 @@ class CSVHandler:
             return False
     
     def import_inventory_from_csv(self, collection_id: int, file_path: str, 
-                                  update_existing: bool = False) -> Dict[str, Any]:
-        """Import inventory from CSV format."""
+                                  update_existing: bool = False,
+                                  progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Import inventory from CSV format.
+        
+        The file is streamed in chunks of IMPORT_CHUNK_SIZE rows so memory use
+        stays bounded regardless of file size. If given, progress_callback is
+        called after each chunk with (characters_read, file_size).
+        """
         results = {
             'success': False,
             'imported': 0,
@@ -101,6 +112,8 @@ class CSVHandler:
             
             self.logger.info(f"Starting CSV import from {file_path}")
             
+            file_size = os.path.getsize(file_path)
+            
             with open(file_path, 'r', encoding='utf-8') as csvfile:
                 # Try to detect the CSV format
                 sample = csvfile.read(1024)
@@ -109,119 +122,40 @@ class CSVHandler:
                 sniffer = csv.Sniffer()
                 delimiter = sniffer.sniff(sample).delimiter
                 
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
+                # Count characters consumed so progress tracks the file position
+                chars_read = 0
+                
+                def counted_lines():
+                    nonlocal chars_read
+                    for line in csvfile:
+                        chars_read += len(line)
+                        yield line
+                
+                reader = csv.DictReader(counted_lines(), delimiter=delimiter)
                 
                 # Validate required columns
                 required_columns = ['Card Name', 'Quantity']
-                missing_columns = [col for col in required_columns if col not in reader.fieldnames]
+                missing_columns = [col for col in required_columns if col not in (reader.fieldnames or [])]
                 
                 if missing_columns:
                     results['errors'].append(f"Missing required columns: {missing_columns}")
                     return results
                 
-                # Convert to list to get total count and avoid multiple iterations
-                rows = list(reader)
-                total_rows = len(rows)
-                results['total_rows'] = total_rows
-                
-                self.logger.info(f"Processing {total_rows} rows from CSV")
-                
-                for row_num, row in enumerate(rows, start=2):  # Start at 2 for header
-                    # Log progress every 50 rows
-                    if (row_num - 1) % 50 == 0:
-                        self.logger.info(f"Processing row {row_num - 1}/{total_rows}")
+                # Stream the file in fixed-size chunks instead of loading every row
+                row_num = 2  # Start at 2 for header
+                while True:
+                    chunk = list(islice(reader, self.IMPORT_CHUNK_SIZE))
+                    if not chunk:
+                        break
                     
-                    try:
-                        card_name = row.get('Card Name', '').strip()
-                        if not card_name:
-                            results['errors'].append(f"Row {row_num}: Empty card name")
-                            continue
-                        
-                        # Parse quantity
-                        try:
-                            quantity = int(row.get('Quantity', '1'))
-                            if quantity <= 0:
-                                results['errors'].append(f"Row {row_num}: Invalid quantity '{quantity}'. Quantity must be positive.")
-                                continue
-                        except ValueError:
-                            results['errors'].append(f"Row {row_num}: Invalid quantity '{row.get('Quantity')}'. Must be a number.")
-                            continue
-                        
-                        # Parse foil status
-                        foil_text = row.get('Foil', 'No').strip().lower()
-                        foil = foil_text in ['yes', 'true', '1', 'foil']
-                        
-                        # Get condition
-                        condition = row.get('Condition', 'Near Mint').strip()
-                        valid_conditions = ['Mint', 'Near Mint', 'Lightly Played', 'Moderately Played', 'Heavily Played', 'Damaged']
-                        if condition not in valid_conditions:
-                            self.logger.warning(f"Row {row_num}: Invalid condition '{condition}' for '{card_name}'. Defaulting to 'Near Mint'.")
-                            condition = 'Near Mint'
-                        
-                        # Use set code and collector number for more precise search if available
-                        set_code = row.get('Set Code', '').strip().lower()
-                        collector_number = row.get('Collector Number', '').strip()
-
-                        card_data = None
-                        if set_code and collector_number:
-                            # Try precise search first
-                            card_data = self.scryfall_client.search_card_by_set_and_collector_number(set_code, collector_number)
-                            if card_data and card_data['name'].lower() != card_name.lower():
-                                self.logger.warning(f"Row {row_num}: Card name '{card_name}' in CSV does not match Scryfall result '{card_data['name']}' for {set_code}/{collector_number}. Using Scryfall data.")
-                                # We can proceed with the found card_data, but it's good to log
-                        
-                        if not card_data:
-                            # Fallback to name search if precise search fails or isn't possible
-                            card_data = self.scryfall_client.search_card_by_name(card_name)
-                            
-                        if not card_data:
-                            results['skipped'] += 1
-                            results['errors'].append(f"Row {row_num}: Card '{card_name}' (Set: {set_code}, Collector #: {collector_number}) not found via Scryfall.")
-                            continue
-                        
-                        # Get or create card in database
-                        try:
-                            card_id = self.inventory_manager.get_or_create_card(card_data)
-                        except Exception as card_error:
-                            results['skipped'] += 1
-                            results['errors'].append(f"Row {row_num}: Failed to save card '{card_name}' to database: {str(card_error)}")
-                            self.logger.error(f"Error saving card data for '{card_name}': {card_error}", exc_info=True)
-                            continue
-                        
-                        # Check if card already exists in inventory for this collection, card_id, foil, and condition
-                        existing_inventory_item = self.db_manager.execute_query(
-                            """SELECT id, quantity FROM inventory 
-                               WHERE collection_id = ? AND card_id = ? AND foil = ? AND condition = ?""",
-                            (collection_id, card_id, foil, condition)
-                        )
-                        
-                        if existing_inventory_item:
-                            if update_existing:
-                                # Update existing quantity
-                                new_quantity = existing_inventory_item[0]['quantity'] + quantity
-                                self.db_manager.execute_update(
-                                    "UPDATE inventory SET quantity = ? WHERE id = ?",
-                                    (new_quantity, existing_inventory_item[0]['id'])
-                                )
-                                results['imported'] += 1
-                                self.logger.info(f"Row {row_num}: Updated {quantity}x '{card_name}' (total {new_quantity}) to collection {collection_id}")
-                            else:
-                                results['skipped'] += 1
-                                results['errors'].append(f"Row {row_num}: Card '{card_name}' (Foil: {foil}, Cond: {condition}) already exists. Skipped. (Use 'Update Existing' option to add quantity).")
-                                self.logger.info(f"Row {row_num}: Skipped existing card '{card_name}' in collection {collection_id}")
-                        else:
-                            # Add new inventory item
-                            self.db_manager.execute_update(
-                                """INSERT INTO inventory (collection_id, card_id, quantity, foil, condition)
-                                   VALUES (?, ?, ?, ?, ?)""",
-                                (collection_id, card_id, quantity, foil, condition)
-                            )
-                            results['imported'] += 1
-                            self.logger.info(f"Row {row_num}: Added {quantity}x '{card_name}' to collection {collection_id}")
-                        
-                    except Exception as e:
-                        results['errors'].append(f"Row {row_num}: General error processing '{row.get('Card Name', 'N/A')}': {str(e)}")
-                        self.logger.error(f"Error processing row {row_num}: {e}", exc_info=True)
+                    self.logger.info(f"Processing rows {row_num - 1}-{row_num + len(chunk) - 2} from CSV")
+                    self.import_chunk(collection_id, chunk, update_existing, results, start_row=row_num)
+                    
+                    row_num += len(chunk)
+                    results['total_rows'] += len(chunk)
+                    
+                    if progress_callback and file_size > 0:
+                        progress_callback(min(chars_read, file_size), file_size)
                 
                 results['success'] = results['imported'] > 0
                 self.logger.info(f"CSV import completed: {results['imported']} imported, {results['skipped']} skipped, {len(results['errors'])} errors")
@@ -232,6 +166,137 @@ class CSVHandler:
         
         return results
     
+    def import_chunk(self, collection_id: int, rows: List[Dict[str, str]], update_existing: bool,
+                     results: Dict[str, Any], start_row: int = 2) -> None:
+        """
+        Import a chunk of parsed CSV rows, accumulating counts into results.
+        
+        Card lookups still run per row, but inventory inserts and quantity
+        updates are collected and written with one executemany each.
+        """
+        # (card_id, foil, condition) -> index into new_items for rows queued in this chunk
+        pending_new = {}
+        new_items = []
+        # inventory id -> new quantity for existing rows touched in this chunk
+        pending_updates = {}
+        
+        for row_num, row in enumerate(rows, start=start_row):
+            try:
+                card_name = row.get('Card Name', '').strip()
+                if not card_name:
+                    results['errors'].append(f"Row {row_num}: Empty card name")
+                    continue
+                
+                # Parse quantity
+                try:
+                    quantity = int(row.get('Quantity', '1'))
+                    if quantity <= 0:
+                        results['errors'].append(f"Row {row_num}: Invalid quantity '{quantity}'. Quantity must be positive.")
+                        continue
+                except ValueError:
+                    results['errors'].append(f"Row {row_num}: Invalid quantity '{row.get('Quantity')}'. Must be a number.")
+                    continue
+                
+                # Parse foil status
+                foil_text = row.get('Foil', 'No').strip().lower()
+                foil = foil_text in ['yes', 'true', '1', 'foil']
+                
+                # Get condition
+                condition = row.get('Condition', 'Near Mint').strip()
+                if condition not in self.VALID_CONDITIONS:
+                    self.logger.warning(f"Row {row_num}: Invalid condition '{condition}' for '{card_name}'. Defaulting to 'Near Mint'.")
+                    condition = 'Near Mint'
+                
+                # Use set code and collector number for more precise search if available
+                set_code = row.get('Set Code', '').strip().lower()
+                collector_number = row.get('Collector Number', '').strip()
+
+                card_data = None
+                if set_code and collector_number:
+                    # Try precise search first
+                    card_data = self.scryfall_client.search_card_by_set_and_collector_number(set_code, collector_number)
+                    if card_data and card_data['name'].lower() != card_name.lower():
+                        self.logger.warning(f"Row {row_num}: Card name '{card_name}' in CSV does not match Scryfall result '{card_data['name']}' for {set_code}/{collector_number}. Using Scryfall data.")
+                        # We can proceed with the found card_data, but it's good to log
+                
+                if not card_data:
+                    # Fallback to name search if precise search fails or isn't possible
+                    card_data = self.scryfall_client.search_card_by_name(card_name)
+                    
+                if not card_data:
+                    results['skipped'] += 1
+                    results['errors'].append(f"Row {row_num}: Card '{card_name}' (Set: {set_code}, Collector #: {collector_number}) not found via Scryfall.")
+                    continue
+                
+                # Get or create card in database
+                try:
+                    card_id = self.inventory_manager.get_or_create_card(card_data)
+                except Exception as card_error:
+                    results['skipped'] += 1
+                    results['errors'].append(f"Row {row_num}: Failed to save card '{card_name}' to database: {str(card_error)}")
+                    self.logger.error(f"Error saving card data for '{card_name}': {card_error}", exc_info=True)
+                    continue
+                
+                # The same card may already be queued earlier in this chunk
+                key = (card_id, foil, condition)
+                if key in pending_new:
+                    if update_existing:
+                        item = new_items[pending_new[key]]
+                        item[2] += quantity
+                        results['imported'] += 1
+                        self.logger.info(f"Row {row_num}: Updated {quantity}x '{card_name}' (total {item[2]}) to collection {collection_id}")
+                    else:
+                        results['skipped'] += 1
+                        results['errors'].append(f"Row {row_num}: Card '{card_name}' (Foil: {foil}, Cond: {condition}) already exists. Skipped. (Use 'Update Existing' option to add quantity).")
+                        self.logger.info(f"Row {row_num}: Skipped existing card '{card_name}' in collection {collection_id}")
+                    continue
+                
+                # Check if card already exists in inventory for this collection, card_id, foil, and condition
+                existing_inventory_item = self.db_manager.execute_query(
+                    """SELECT id, quantity FROM inventory 
+                       WHERE collection_id = ? AND card_id = ? AND foil = ? AND condition = ?""",
+                    (collection_id, card_id, foil, condition)
+                )
+                
+                if existing_inventory_item:
+                    if update_existing:
+                        # Update existing quantity, including updates queued earlier in this chunk
+                        item_id = existing_inventory_item[0]['id']
+                        new_quantity = pending_updates.get(item_id, existing_inventory_item[0]['quantity']) + quantity
+                        pending_updates[item_id] = new_quantity
+                        results['imported'] += 1
+                        self.logger.info(f"Row {row_num}: Updated {quantity}x '{card_name}' (total {new_quantity}) to collection {collection_id}")
+                    else:
+                        results['skipped'] += 1
+                        results['errors'].append(f"Row {row_num}: Card '{card_name}' (Foil: {foil}, Cond: {condition}) already exists. Skipped. (Use 'Update Existing' option to add quantity).")
+                        self.logger.info(f"Row {row_num}: Skipped existing card '{card_name}' in collection {collection_id}")
+                else:
+                    # Queue new inventory item
+                    pending_new[key] = len(new_items)
+                    new_items.append([collection_id, card_id, quantity, foil, condition])
+                    results['imported'] += 1
+                    self.logger.info(f"Row {row_num}: Added {quantity}x '{card_name}' to collection {collection_id}")
+                
+            except Exception as e:
+                results['errors'].append(f"Row {row_num}: General error processing '{row.get('Card Name', 'N/A')}': {str(e)}")
+                self.logger.error(f"Error processing row {row_num}: {e}", exc_info=True)
+        
+        # Write the queued changes for the whole chunk in a single transaction
+        if pending_updates or new_items:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    "UPDATE inventory SET quantity = ? WHERE id = ?",
+                    [(quantity, item_id) for item_id, quantity in pending_updates.items()]
+                )
+                cursor.executemany(
+                    """INSERT INTO inventory (collection_id, card_id, quantity, foil, condition)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    new_items
+                )
+                conn.commit()
+    
     def export_deck_to_csv(self, deck_id: int, file_path: str) -> bool:
         """Export deck to CSV format."""
         try:
@@ -6,6 +6,8 @@ Database management utilities for MTG Collection Manager.
 import sqlite3
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
@@ -16,11 +18,16 @@ class DatabaseManager:
         """Initialize database manager with the specified database path."""
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        self._batch = threading.local()
         
     def get_connection(self) -> sqlite3.Connection:
         """Get a database connection with row factory enabled."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Per-connection tuning; safe with WAL (see initialize_database)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
         return conn
     
     def initialize_database(self):
@@ -28,6 +35,10 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
+            # Write-ahead logging is persistent in the database file, so it only
+            # needs to be enabled once; readers no longer block the writer
+            cursor.execute("PRAGMA journal_mode=WAL")
+            
             # Collections table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS collections (
@@ -216,6 +227,9 @@ class DatabaseManager:
                         )
                     """)
             
+            # Trade details are looked up by transaction
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_transaction_id ON trades (transaction_id)")
+            
             conn.commit()
             
             # Create default collection if none exists
@@ -226,8 +240,29 @@ class DatabaseManager:
                 
         self.logger.info("Database initialized successfully")
     
+    @contextmanager
+    def read_batch(self):
+        """Run every SELECT issued on this thread inside the block on one connection and snapshot."""
+        if getattr(self._batch, 'conn', None) is not None:
+            yield
+            return
+        
+        conn = self.get_connection()
+        try:
+            conn.execute("BEGIN")
+            self._batch.conn = conn
+            yield
+        finally:
+            self._batch.conn = None
+            conn.rollback()
+            conn.close()
+    
     def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """Execute a SELECT query and return results."""
+        batch_conn = getattr(self._batch, 'conn', None)
+        if batch_conn is not None:
+            return batch_conn.execute(query, params).fetchall()
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
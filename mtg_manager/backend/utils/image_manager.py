@@ -7,15 +7,23 @@ Handles downloading, caching, and processing card images.
 import os
 import requests
 import logging
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 from PIL import Image, ImageTk
 import threading
 import hashlib
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 class ImageManager:
     """Manages card image downloading, caching, and processing."""
     
+    # Seconds a cache directory listing stays valid
+    LISTING_TTL = 2.0
+    
+    # Most PhotoImages kept in memory; least recently used are dropped first
+    IMAGE_CACHE_SIZE = 128
+    
     def __init__(self, cache_dir: str = "assets/card_images"):
         """Initialize image manager."""
         self.cache_dir = cache_dir
@@ -32,12 +40,59 @@ class ImageManager:
             'original': None            # Full size
         }
         
-        # Cache for loaded PIL images to avoid reloading
-        self._image_cache = {}
-        self._download_queue = set()    # Track ongoing downloads
+        # LRU cache of loaded Tk images to avoid re-decoding (cache key -> PhotoImage)
+        self._image_cache = OrderedDict()
+        self._download_queue = {}       # Ongoing downloads: cache key -> Future
+        self._queue_lock = threading.Lock()
+        
+        # Shared worker pool for all image downloads
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='image-download')
+        
+        # Running cache totals, kept up to date on every write and removal
+        self._stats_lock = threading.Lock()
+        self._count, self._total_size = self._scan_cache_totals()
+        
+        # On a dedicated cache filesystem, used space comes from one statvfs call
+        self._cache_is_mount = hasattr(os, 'statvfs') and os.path.ismount(cache_dir)
+        
+        # Short-lived directory listing shared by consecutive cache operations
+        self._listing_cache = []
+        self._listing_ts = float('-inf')
         
         self.logger.info(f"ImageManager initialized with cache directory: {cache_dir}")
     
+    def _scan_cache_totals(self) -> Tuple[int, int]:
+        """Count cached files and their total size in bytes with one directory pass."""
+        count = 0
+        total_size = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    count += 1
+                    total_size += entry.stat().st_size
+        return count, total_size
+    
+    def _record_cache_change(self, files: int, size: int):
+        """Adjust the running cache totals."""
+        with self._stats_lock:
+            self._count += files
+            self._total_size += size
+        self._listing_ts = float('-inf')  # Listing no longer matches the directory
+    
+    def list_cache_entries(self) -> list:
+        """
+        List the cache directory as os.DirEntry objects.
+        
+        The listing is reused for LISTING_TTL seconds so back-to-back cache
+        actions share one scan; DirEntry also caches its stat result.
+        """
+        now = time.monotonic()
+        if now - self._listing_ts >= self.LISTING_TTL:
+            with os.scandir(self.cache_dir) as entries:
+                self._listing_cache = list(entries)
+            self._listing_ts = now
+        return self._listing_cache
+    
     def _get_cache_filename(self, image_url: str, size: str = 'medium') -> str:
         """Generate cache filename from image URL and size."""
         # Create hash of URL for filename
@@ -79,55 +134,72 @@ class ImageManager:
                 callback(True, self._get_cache_path(image_url, size))
             return True
         
-        # Check if already downloading
-        cache_key = f"{image_url}_{size}"
-        if cache_key in self._download_queue:
-            return False
+        # A download already running for this image is shared, callback included
+        future = self.download_image_async(image_url, size)
+        if callback:
+            # Runs on the worker thread, as before
+            future.add_done_callback(lambda f: callback(f.result() is not None, f.result()))
+        return True
+    
+    def download_image_async(self, image_url: str, size: str = 'medium') -> Future:
+        """
+        Download and cache an image on the shared download pool.
         
-        self._download_queue.add(cache_key)
+        Args:
+            image_url: URL of the image to download
+            size: Size preset to save ('thumbnail', 'medium', 'large', 'original')
+            
+        Returns:
+            Future resolving to the cache path, or None if the download failed.
+            Concurrent requests for the same image share one Future.
+        """
+        if not image_url or self.is_image_cached(image_url, size):
+            future = Future()
+            future.set_result(self._get_cache_path(image_url, size) if image_url else None)
+            return future
         
-        def download_worker():
-            try:
-                self.logger.debug(f"Downloading image: {image_url}")
-                
-                # Download image with timeout
-                response = requests.get(image_url, timeout=30, stream=True)
-                response.raise_for_status()
-                
-                # Load image with PIL
-                image = Image.open(response.raw)
-                
-                # Resize if needed
-                if size in self.image_sizes and self.image_sizes[size] is not None:
-                    target_size = self.image_sizes[size]
-                    # Maintain aspect ratio
-                    image.thumbnail(target_size, Image.Resampling.LANCZOS)
-                
-                # Save to cache
-                cache_path = self._get_cache_path(image_url, size)
-                image.save(cache_path, 'PNG', optimize=True)
-                
-                self.logger.debug(f"Image cached: {cache_path}")
-                
-                # Call callback if provided
-                if callback:
-                    callback(True, cache_path)
-                
-                return True
-                
-            except Exception as e:
-                self.logger.error(f"Failed to download image {image_url}: {e}")
-                if callback:
-                    callback(False, None)
-                return False
+        cache_key = f"{image_url}_{size}"
+        with self._queue_lock:
+            future = self._download_queue.get(cache_key)
+            if future is None:
+                future = self._executor.submit(self._download_worker, image_url, size, cache_key)
+                self._download_queue[cache_key] = future
+        return future
+    
+    def _download_worker(self, image_url: str, size: str, cache_key: str) -> Optional[str]:
+        """Download, resize and cache one image; returns the cache path or None."""
+        try:
+            self.logger.debug(f"Downloading image: {image_url}")
+            
+            # Download image with timeout
+            response = requests.get(image_url, timeout=30, stream=True)
+            response.raise_for_status()
+            
+            # Load image with PIL
+            image = Image.open(response.raw)
+            
+            # Resize if needed
+            if size in self.image_sizes and self.image_sizes[size] is not None:
+                target_size = self.image_sizes[size]
+                # Maintain aspect ratio
+                image.thumbnail(target_size, Image.Resampling.LANCZOS)
             
-            finally:
-                # Remove from download queue
-                self._download_queue.discard(cache_key)
+            # Save to cache
+            cache_path = self._get_cache_path(image_url, size)
+            image.save(cache_path, 'PNG', optimize=True)
+            self._record_cache_change(1, os.path.getsize(cache_path))
+            
+            self.logger.debug(f"Image cached: {cache_path}")
+            return cache_path
+            
+        except Exception as e:
+            self.logger.error(f"Failed to download image {image_url}: {e}")
+            return None
         
-        # Start download in background thread
-        threading.Thread(target=download_worker, daemon=True).start()
-        return True
+        finally:
+            # Remove from download queue
+            with self._queue_lock:
+                self._download_queue.pop(cache_key, None)
     
     def get_image_path(self, image_url: str, size: str = 'medium') -> Optional[str]:
         """Get cached image path if it exists."""
@@ -157,20 +229,19 @@ class ImageManager:
             cache_key = f"{image_url}_{size}"
             if cache_key in self._image_cache:
                 self.logger.debug(f"Image found in memory cache: {cache_key}")
+                self._image_cache.move_to_end(cache_key)
                 return self._image_cache[cache_key]
             
             # Try to load from cache
             cache_path = self.get_image_path(image_url, size)
             self.logger.debug(f"Cache path: {cache_path}")
             
-            if cache_path and os.path.exists(cache_path):
+            if cache_path:  # get_image_path only returns existing files
                 self.logger.debug(f"Loading image from cache: {cache_path}")
-                # Load from cache
-                pil_image = Image.open(cache_path)
-                tk_image = ImageTk.PhotoImage(pil_image)
-                
-                # Cache the loaded image
-                self._image_cache[cache_key] = tk_image
+                # Load from cache; cached files are already resized to the size
+                # preset (see _download_worker), so only the small PNG is decoded
+                with Image.open(cache_path) as pil_image:
+                    tk_image = self.cache_tk_image(image_url, size, pil_image)
                 self.logger.debug(f"Image loaded successfully: {cache_path}")
                 return tk_image
             
@@ -183,6 +254,50 @@ class ImageManager:
             self.logger.error(f"Failed to load image for Tkinter: {e}")
             return self.create_placeholder_image(fallback_size)
     
+    def decode_cached_image(self, image_url: str, size: str = 'medium') -> Optional[Image.Image]:
+        """
+        Decode a cached image into memory without touching Tkinter.
+        
+        Safe to call from worker threads; pass the result to cache_tk_image
+        on the Tk thread.
+        
+        Args:
+            image_url: URL of the image
+            size: Size preset
+            
+        Returns:
+            Decoded PIL image, or None if it is not cached or cannot be read
+        """
+        try:
+            pil_image = Image.open(self._get_cache_path(image_url, size))
+            pil_image.load()  # Reads the pixels and closes the file
+            return pil_image
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to decode cached image {image_url}: {e}")
+            return None
+    
+    def cache_tk_image(self, image_url: str, size: str, pil_image: Image.Image) -> ImageTk.PhotoImage:
+        """
+        Create the PhotoImage for a decoded image and keep it in the memory cache.
+        
+        Must be called on the Tk thread.
+        
+        Args:
+            image_url: URL of the image
+            size: Size preset
+            pil_image: Decoded image, e.g. from decode_cached_image
+            
+        Returns:
+            PhotoImage for Tkinter
+        """
+        tk_image = ImageTk.PhotoImage(pil_image)
+        
+        # Cache the loaded image, evicting the least recently used
+        self._image_cache[f"{image_url}_{size}"] = tk_image
+        if len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+        return tk_image
+    
     def create_placeholder_image(self, size: Tuple[int, int] = (146, 204)) -> ImageTk.PhotoImage:
         """Create a placeholder image when card image is not available."""
         try:
@@ -222,7 +337,7 @@ class ImageManager:
             return ImageTk.PhotoImage(image)
     
     def preload_images(self, image_urls: list, size: str = 'medium', 
-                       progress_callback: Optional[callable] = None):
+                       progress_callback: Optional[callable] = None) -> threading.Event:
         """
         Preload multiple images in background.
         
@@ -230,15 +345,21 @@ class ImageManager:
             image_urls: List of image URLs to preload
             size: Size preset to download
             progress_callback: Optional callback with (current, total) progress
+            
+        Returns:
+            Event that stops the preload before its next download once set
         """
+        cancelled = threading.Event()
         if not image_urls:
-            return
+            return cancelled
         
         def preload_worker():
             total = len(image_urls)
             completed = 0
             
             for i, url in enumerate(image_urls):
+                if cancelled.is_set():
+                    return
                 if url and not self.is_image_cached(url, size):
                     self.download_image(url, size)
                     # Small delay to avoid overwhelming the server
@@ -249,48 +370,58 @@ class ImageManager:
                     progress_callback(completed, total)
         
         threading.Thread(target=preload_worker, daemon=True).start()
+        return cancelled
+    
+    def list_cache_files(self) -> list:
+        """List the names of all cached image files."""
+        return [entry.name for entry in self.list_cache_entries() if entry.is_file()]
     
-    def clear_cache(self, older_than_days: int = 30) -> int:
+    def remove_cache_files(self, file_names: Iterable[str]) -> int:
         """
-        Clear old cached images.
+        Remove the given files from the cache.
         
         Args:
-            older_than_days: Remove images older than this many days
+            file_names: Cache file names, as returned by list_cache_files
             
         Returns:
             Number of files removed
         """
+        # Sizes come from the listing's DirEntry stats, so each file costs one unlink
+        entries = {entry.name: entry for entry in self.list_cache_entries()}
+        removed_count = 0
+        removed_size = 0
         try:
-            removed_count = 0
-            cutoff_time = time.time() - (older_than_days * 24 * 60 * 60)
-            
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                
-                if os.path.isfile(file_path):
-                    file_time = os.path.getmtime(file_path)
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
-                        removed_count += 1
-            
-            self.logger.info(f"Cleared {removed_count} old cached images")
-            return removed_count
-            
-        except Exception as e:
-            self.logger.error(f"Failed to clear cache: {e}")
-            return 0
+            for name in file_names:
+                entry = entries.get(name)
+                if entry is None:
+                    continue  # Not in the cache
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue  # Removed since the listing was taken
+                except OSError as e:
+                    self.logger.warning(f"Could not remove cached image {name}: {e}")
+                    continue
+                removed_count += 1
+                removed_size += size
+        finally:
+            self._record_cache_change(-removed_count, -removed_size)
+        
+        self.logger.info(f"Removed {removed_count} cached images")
+        return removed_count
     
     def get_cache_stats(self) -> dict:
-        """Get statistics about the image cache."""
+        """Get statistics about the image cache from the running totals."""
         try:
-            total_files = 0
-            total_size = 0
+            with self._stats_lock:
+                total_files = self._count
+                total_size = self._total_size
             
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(file_path):
-                    total_files += 1
-                    total_size += os.path.getsize(file_path)
+            if self._cache_is_mount:
+                # Block-aligned, so slightly above the sum of file sizes
+                vfs = os.statvfs(self.cache_dir)
+                total_size = (vfs.f_blocks - vfs.f_bfree) * vfs.f_frsize
             
             return {
                 'total_files': total_files,
@@ -7,12 +7,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import logging
 import threading
-from typing import Dict, Any
+from typing import Dict, Any, List
 import csv
 import os # Added for debug_image_cache
+import queue
+import re
+import time
+from functools import cached_property, lru_cache, partial, wraps
+from itertools import islice
+from operator import itemgetter
 
 from backend.utils.db import DatabaseManager
 from backend.data.inventory import InventoryManager
+from backend.data.models import Collection
 from backend.decks.deck_builder import DeckBuilder
 from backend.data.trade_tracker import TradeTracker
 from backend.utils.backup import BackupManager
@@ -24,6 +31,53 @@ from frontend.views.deck_view import DeckView
 from frontend.views.card_browser import CardBrowser
 from frontend.views.trade_view import TradeView # NEW: Import TradeView
 
+@lru_cache(maxsize=256)
+def _fmt_collection(name: str, collection_id: int) -> str:
+    """Format a collection for display in the collection combo box."""
+    return f"{name} (ID: {collection_id})"
+
+# Fallback parser for combo labels not produced by load_collections
+_COLLECTION_ID_RE = re.compile(r"ID:\s*(\d+)\)")
+
+# Last Ollama availability probe; reused for OLLAMA_PROBE_TTL seconds. Not an
+# lru_cache because the answer goes stale as Ollama starts and stops.
+OLLAMA_PROBE_TTL = 10.0
+_ollama_probe_cache = {'t': float('-inf'), 'ok': False}
+
+# Interval and batch size of the UI queue pump (see MTGCollectionApp._drain_ui)
+UI_PUMP_INTERVAL_MS = 50
+UI_PUMP_BATCH = 32
+
+# Columns shown in the CSV import preview and their defaults when absent
+_PREVIEW_FIELDS = (
+    ('Card Name', ''),
+    ('Quantity', '1'),
+    ('Foil', 'No'),
+    ('Condition', 'Near Mint'),
+)
+
+_ABOUT_TEXT = (
+    "MTG Collection Manager v1.0\n\n"
+    "A desktop application for managing Magic: The Gathering\n"
+    "card collections and deck building.\n\n"
+    "Built with Python and Tkinter\n"
+    "Card data provided by Scryfall API"
+)
+
+def gui_action(failure_message: str):
+    """Decorate a menu action so any exception is logged and shown as an error dialog."""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.exception(failure_message)
+                messagebox.showerror("Error", f"{failure_message}: {e}")
+                self.update_status(f"{failure_message}.")
+        return wrapper
+    return decorator
+
 class MTGCollectionApp:
     """Main application window for MTG Collection Manager."""
     
@@ -35,27 +89,97 @@ class MTGCollectionApp:
         # Initialize shared components first
         self.db_manager = DatabaseManager()
         
-        # Create single ScryfallClient instance for the entire app
-        self.scryfall_client = ScryfallClient.get_instance()
-        self.logger.info("Shared ScryfallClient instance created")
-        
-        # Initialize Image Manager
-        from backend.utils.image_manager import ImageManager
-        self.image_manager = ImageManager()
-        self.logger.info("Image Manager initialized")
-        
-        # Initialize backend managers with shared scryfall client
-        self.inventory_manager = InventoryManager(self.db_manager, self.scryfall_client)
-        self.deck_builder = DeckBuilder(self.db_manager)
-        self.trade_tracker = TradeTracker(self.db_manager)
-        self.backup_manager = BackupManager(self.db_manager)
-        self.csv_handler = CSVHandler(self.db_manager, self.scryfall_client) # Pass scryfall_client to CSVHandler
+        # The shared ScryfallClient and the backend managers are created lazily on first access
         
         # Current collection
         self.current_collection_id = 1  # Default collection
+        self._collection_ids: Dict[str, int] = {}  # Combo label -> collection ID
+        self._pending_refresh: Dict[int, Any] = {}  # Views awaiting a coalesced refresh, by id()
         
         self.setup_ui()
         self.load_collections()
+        
+        # Worker threads hand UI work to the Tk thread through this queue
+        self._ui_queue = queue.Queue()
+        self.root.after(UI_PUMP_INTERVAL_MS, self._drain_ui)
+        
+        # Import the scanner stack (cv2, numpy, Ollama client) off the UI thread
+        self._OllamaClient = None
+        self._VisionScannerWindow = None
+        threading.Thread(target=self._preload_scanner, daemon=True).start()
+    
+    def post_to_ui(self, func, *args):
+        """Queue func(*args) to run on the Tk thread; safe to call from any thread."""
+        self._ui_queue.put(partial(func, *args))
+    
+    def _drain_ui(self):
+        """Run queued UI callbacks in batches, then reschedule."""
+        try:
+            for _ in range(UI_PUMP_BATCH):
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback()
+                except Exception:
+                    self.logger.exception("Queued UI callback failed")
+        finally:
+            self.root.after(UI_PUMP_INTERVAL_MS, self._drain_ui)
+    
+    def _preload_scanner(self):
+        """Import the AI Vision scanner classes in the background."""
+        try:
+            from backend.ai.ollama_client import OllamaClient
+            from frontend.views.ocr_scanner import VisionScannerWindow
+        except Exception as e:
+            # open_ocr_scanner retries the import and reports the error
+            self.logger.debug(f"Scanner preload failed: {e}")
+            return
+        self._OllamaClient = OllamaClient
+        self._VisionScannerWindow = VisionScannerWindow
+    
+    # Lazily created backend managers (sharing the db manager and scryfall client)
+    @cached_property
+    def image_manager(self):
+        """Image manager, created on first use."""
+        from backend.utils.image_manager import ImageManager
+        image_manager = ImageManager()
+        self.logger.info("Image Manager initialized")
+        return image_manager
+    
+    @cached_property
+    def scryfall_client(self) -> ScryfallClient:
+        """Shared ScryfallClient, waiting for main's background preload if it is still running."""
+        return ScryfallClient.get_instance()
+    
+    @cached_property
+    def inventory_manager(self) -> InventoryManager:
+        """Inventory manager, created on first use."""
+        # No client passed: the manager resolves the shared singleton only when a
+        # card lookup needs it, so startup's collection and inventory loads don't
+        # wait for main's background card cache preload
+        return InventoryManager(self.db_manager)
+    
+    @cached_property
+    def deck_builder(self) -> DeckBuilder:
+        """Deck builder, created on first use."""
+        return DeckBuilder(self.db_manager)
+    
+    @cached_property
+    def trade_tracker(self) -> TradeTracker:
+        """Trade tracker, created on first use."""
+        return TradeTracker(self.db_manager)
+    
+    @cached_property
+    def backup_manager(self) -> BackupManager:
+        """Backup manager, created on first use."""
+        return BackupManager(self.db_manager)
+    
+    @cached_property
+    def csv_handler(self) -> CSVHandler:
+        """CSV handler, created on first use."""
+        return CSVHandler(self.db_manager, self.scryfall_client) # Pass scryfall_client to CSVHandler
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -163,23 +287,64 @@ class MTGCollectionApp:
         
         self.status_label = ttk.Label(self.status_bar, text="Ready")
         self.status_label.pack(side=tk.LEFT, padx=5, pady=2)
+        
+        # Shown only while a long-running task is in progress
+        self.status_progress = ttk.Progressbar(self.status_bar, mode='indeterminate', length=150)
     
-    def load_collections(self):
+    def load_collections(self, collections: List[Collection] = None):
         """Load collections into the combo box."""
-        collections = self.inventory_manager.get_collections()
-        collection_names = [f"{col.name} (ID: {col.id})" for col in collections]
+        if collections is None:
+            collections = self.inventory_manager.get_collections()
+        collection_names = [_fmt_collection(col.name, col.id) for col in collections]
+        self._collection_ids = dict(zip(collection_names, (col.id for col in collections)))
         
         self.collection_combo['values'] = collection_names
         if collection_names:
             self.collection_combo.set(collection_names[0])
             self.current_collection_id = collections[0].id
     
+    def full_reload(self):
+        """Reload collections and every view from one database snapshot."""
+        with self.db_manager.read_batch():
+            collections = self.inventory_manager.get_collections()
+            self.load_collections(collections)
+            collection_id = self.current_collection_id
+            inventory = self.inventory_manager.get_inventory(collection_id)
+            decks = self.deck_builder.get_decks(collection_id)
+            transactions = self.trade_tracker.get_trade_transactions(
+                collection_id, self.trade_view.date_filter_cutoff()
+            )
+            trade_stats = self.trade_tracker.get_trade_stats(collection_id)
+        
+        self.inventory_view.load_inventory(inventory)
+        self.deck_view.populate(decks)
+        self.trade_view.populate(transactions, trade_stats)
+    
+    def request_refresh(self, *views):
+        """Refresh the given views once the UI is idle, coalescing repeated requests into one pass."""
+        if views and not self._pending_refresh:
+            self.root.after_idle(self._run_requested_refresh)
+        for view in views:
+            self._pending_refresh[id(view)] = view
+    
+    def _run_requested_refresh(self):
+        """Refresh every view queued by request_refresh from one database snapshot."""
+        views, self._pending_refresh = list(self._pending_refresh.values()), {}
+        with self.db_manager.read_batch():
+            for view in views:
+                view.refresh()
+    
     def on_collection_changed(self, event=None):
         """Handle collection selection change."""
         selected = self.collection_var.get()
         if selected:
-            # Extract collection ID from the selected text
-            collection_id = int(selected.split("ID: ")[1].split(")")[0])
+            # Look up the collection ID recorded when the combo was populated
+            collection_id = self._collection_ids.get(selected)
+            if collection_id is None:
+                match = _COLLECTION_ID_RE.search(selected)
+                if not match:
+                    return
+                collection_id = int(match.group(1))
             self.current_collection_id = collection_id
             
             # Refresh all views
@@ -192,7 +357,31 @@ class MTGCollectionApp:
     def update_status(self, message: str):
         """Update the status bar message."""
         self.status_label.config(text=message)
-        self.root.update_idletasks()
+    
+    def start_busy(self, message: str):
+        """Show a status message with the status bar progress indicator running."""
+        self.update_status(message)
+        self.status_progress.pack(side=tk.RIGHT, padx=5, pady=2)
+        self.status_progress.start(15)
+    
+    def stop_busy(self, message: str = "Ready"):
+        """Hide the status bar progress indicator."""
+        self.status_progress.stop()
+        self.status_progress.configure(mode='indeterminate', value=0)
+        self.status_progress.pack_forget()
+        self.update_status(message)
+    
+    def _post_busy_progress(self, current: int, total: int):
+        """Forward (current, total) progress from a worker thread to the status bar."""
+        if total:
+            self.root.after(0, self._set_busy_progress, current / total * 100)
+    
+    def _set_busy_progress(self, percent: float):
+        """Switch the status bar indicator to determinate progress."""
+        if str(self.status_progress['mode']) != 'determinate':
+            self.status_progress.stop()
+            self.status_progress.configure(mode='determinate', maximum=100)
+        self.status_progress['value'] = percent
     
     # Menu command implementations
     def new_collection(self):
@@ -218,6 +407,7 @@ class MTGCollectionApp:
             if name:
                 try:
                     collection_id = self.inventory_manager.create_collection(name)
+                    _fmt_collection.cache_clear()
                     self.load_collections()
                     # Select the new collection
                     for i, value in enumerate(self.collection_combo['values']):
@@ -380,7 +570,7 @@ class MTGCollectionApp:
         dialog.grab_set()
         
         # File info
-        ttk.Label(dialog, text=f"File: {file_path.split('/')[-1]}", 
+        ttk.Label(dialog, text=f"File: {os.path.basename(file_path)}", 
                             font=('TkDefaultFont', 10, 'bold')).pack(pady=10)
         
         # Import options
@@ -459,30 +649,49 @@ class MTGCollectionApp:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Load preview data using shared scryfall client
+        preview_rows = []
         try:
-            # Use the app's shared scryfall client for the CSVHandler
-            csv_handler_preview = CSVHandler(self.db_manager, self.scryfall_client)
-            
+            # Names known to the shared scryfall client's cache
+            cached_names = self.scryfall_client.get_name_set()
+
             with open(file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for i, row in enumerate(reader):
-                    if i >= 10:  # Only show first 10 rows
-                        break
-                    
-                    card_name = row.get('Card Name', '').strip()
-                    quantity = row.get('Quantity', '1')
-                    foil = row.get('Foil', 'No')
-                    condition = row.get('Condition', 'Near Mint')
-                    
-                    # Check if card exists in database using scryfall_client from csv_handler
-                    card_data = csv_handler_preview.scryfall_client.search_card_in_cache(card_name)
-                    status = "✓ Found" if card_data else "⚠ Not Found"
-                    
-                    tree.insert('', tk.END, values=(card_name, quantity, foil, condition, status))
-            
+                reader = csv.reader(csvfile)
+                header = next(reader, [])
+                width = len(header)
+
+                # Resolve column positions once; columns missing from the header
+                # are served from a defaults tail appended to each row
+                defaults_tail = []
+                positions = []
+                for name, default in _PREVIEW_FIELDS:
+                    if name in header:
+                        positions.append(header.index(name))
+                    else:
+                        positions.append(width + len(defaults_tail))
+                        defaults_tail.append(default)
+                extract = itemgetter(*positions)
+
+                # Like DictReader, skip blank lines and pad short rows
+                for row in islice(filter(None, reader), 10):  # Only show first 10 rows
+                    row = row[:width] + [''] * (width - len(row))
+                    card_name, quantity, foil, condition = extract(row + defaults_tail)
+                    card_name = card_name.strip()
+
+                    # Check if card exists in the local card cache
+                    status = "✓ Found" if card_name.lower() in cached_names else "⚠ Not Found"
+
+                    preview_rows.append((card_name, quantity, foil, condition, status))
+
         except Exception as e:
-            tree.insert('', tk.END, values=("Error reading file", str(e), "", "", "✗ Error"))
-        
+            preview_rows.append(("Error reading file", str(e), "", "", "✗ Error"))
+
+        # Insert all rows in one batch with columns hidden, then restore them
+        # on idle so the tree lays out once instead of once per row
+        tree.configure(displaycolumns=())
+        for values in preview_rows:
+            tree.insert('', tk.END, values=values)
+        tree.after_idle(lambda: tree.configure(displaycolumns=columns))
+
         # Button frame
         button_frame = ttk.Frame(preview_dialog)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -506,19 +715,26 @@ class MTGCollectionApp:
                 csv_handler_import = CSVHandler(self.db_manager, self.scryfall_client)
                 
                 if status_label:
-                    self.root.after(0, lambda: status_label.config(text="Importing CSV..."))
+                    self.root.after(0, partial(status_label.config, text="Importing CSV..."))
+                
+                self.root.after(0, partial(self.update_status, "Importing CSV..."))
                 
-                self.root.after(0, lambda: self.update_status("Importing CSV..."))
+                # Report progress after each imported chunk
+                progress_callback = None
+                if progress_var:
+                    def progress_callback(current, total):
+                        self.root.after(0, partial(progress_var.set, current / total * 100))
                 
                 results = csv_handler_import.import_inventory_from_csv(
-                    self.current_collection_id, file_path, update_existing
+                    self.current_collection_id, file_path, update_existing,
+                    progress_callback=progress_callback
                 )
                 
                 # Update UI in main thread
-                self.root.after(0, lambda: self.handle_csv_import_results(results, dialog))
+                self.root.after(0, partial(self.handle_csv_import_results, results, dialog))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.handle_csv_import_error(str(e), dialog))
+                self.root.after(0, partial(self.handle_csv_import_error, str(e), dialog))
         
         # Start import in background thread
         threading.Thread(target=import_worker, daemon=True).start()
@@ -528,29 +744,31 @@ class MTGCollectionApp:
         if dialog:
             dialog.destroy()
         
+        errors = results.get('errors', [])
+        
         if results['success']:
-            message = (f"Import completed!\n\n"
-                       f"Imported: {results['imported']} cards\n"
-                       f"Skipped: {results['skipped']} cards\n"
-                       f"Total rows processed: {results['total_rows']}")
+            parts = [f"Import completed!\n\n"
+                     f"Imported: {results['imported']} cards\n"
+                     f"Skipped: {results['skipped']} cards\n"
+                     f"Total rows processed: {results['total_rows']}"]
             
-            if results['errors']:
-                message += f"\n\nErrors encountered: {len(results['errors'])}"
-                if len(results['errors']) <= 5:
-                    message += "\n" + "\n".join(results['errors'][:5])
+            if errors:
+                # Only the first few errors are shown, so only those are joined
+                head = "\n".join(errors[:5])
+                parts.append(f"\n\nErrors encountered: {len(errors)}")
+                if len(errors) <= 5:
+                    parts.append("\n" + head)
                 else:
-                    message += f"\nFirst 5 errors:\n" + "\n".join(results['errors'][:5])
-                    message += f"\n... and {len(results['errors']) - 5} more errors"
+                    parts.append("\nFirst 5 errors:\n" + head)
+                    parts.append(f"\n... and {len(errors) - 5} more errors")
             
-            messagebox.showinfo("Import Results", message)
+            messagebox.showinfo("Import Results", "".join(parts))
             
             # Refresh inventory view
             self.inventory_view.refresh()
             self.update_status(f"Imported {results['imported']} cards from CSV")
         else:
-            error_message = "Import failed!\n\n"
-            if results['errors']:
-                error_message += "\n".join(results['errors'][:10])
+            error_message = "Import failed!\n\n" + "\n".join(errors[:10])
             messagebox.showerror("Import Failed", error_message)
             self.update_status("CSV import failed")
     
@@ -573,6 +791,7 @@ class MTGCollectionApp:
         if file_path:
             try:
                 self.update_status("Exporting to CSV...")
+                self.root.update_idletasks()  # Show status before the blocking export
                 
                 success = self.csv_handler.export_inventory_to_csv(
                     self.current_collection_id, file_path
@@ -665,6 +884,7 @@ TIPS:
             try:
                 success = self.backup_manager.import_from_json(file_path, merge=True)
                 if success:
+                    self.trade_tracker.clear_stats_cache()
                     self.load_collections()
                     self.inventory_view.refresh()
                     self.deck_view.refresh()
@@ -693,6 +913,7 @@ TIPS:
             except Exception as e:
                 messagebox.showerror("Error", f"Export failed: {e}")
     
+    @gui_action("Backup failed")
     def backup_database(self):
         """Create database backup."""
         file_path = filedialog.asksaveasfilename(
@@ -702,15 +923,31 @@ TIPS:
         )
         
         if file_path:
-            try:
-                success = self.backup_manager.create_backup(file_path)
-                if success:
-                    messagebox.showinfo("Success", "Database backed up successfully")
-                else:
-                    messagebox.showerror("Error", "Failed to create backup")
-            except Exception as e:
-                messagebox.showerror("Error", f"Backup failed: {e}")
+            self.start_busy("Backing up database...")
+            threading.Thread(target=self._do_backup, args=(file_path,), daemon=True).start()
+    
+    def _do_backup(self, file_path: str):
+        """Create a backup on a worker thread and report back on the Tk thread."""
+        try:
+            success = self.backup_manager.create_backup(
+                file_path, progress_callback=self._post_busy_progress
+            )
+            error = None
+        except Exception as e:
+            success, error = False, e
+        self.root.after(0, self._backup_finished, success, error)
     
+    def _backup_finished(self, success: bool, error: Exception = None):
+        """Show the outcome of a background backup."""
+        self.stop_busy("Ready")
+        if error:
+            messagebox.showerror("Error", f"Backup failed: {error}")
+        elif success:
+            messagebox.showinfo("Success", "Database backed up successfully")
+        else:
+            messagebox.showerror("Error", "Failed to create backup")
+    
+    @gui_action("Restore failed")
     def restore_database(self):
         """Restore database from backup."""
         file_path = filedialog.askopenfilename(
@@ -724,29 +961,51 @@ TIPS:
                 "This will replace your current database. Are you sure?"
             )
             if result:
-                try:
-                    success = self.backup_manager.restore_backup(file_path)
-                    if success:
-                        self.load_collections()
-                        self.inventory_view.refresh()
-                        self.deck_view.refresh()
-                        self.trade_view.refresh() # NEW: Refresh TradeView after restore
-                        messagebox.showinfo("Success", "Database restored successfully")
-                    else:
-                        messagebox.showerror("Error", "Failed to restore database")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Restore failed: {e}")
+                self.start_busy("Restoring database...")
+                threading.Thread(target=self._do_restore, args=(file_path,), daemon=True).start()
+    
+    def _do_restore(self, file_path: str):
+        """Restore a backup on a worker thread and report back on the Tk thread."""
+        try:
+            success = self.backup_manager.restore_backup(
+                file_path, progress_callback=self._post_busy_progress
+            )
+            error = None
+        except Exception as e:
+            success, error = False, e
+        self.root.after(0, self._restore_finished, success, error)
+    
+    def _restore_finished(self, success: bool, error: Exception = None):
+        """Reload the views and show the outcome of a background restore."""
+        self.stop_busy("Ready")
+        if error:
+            messagebox.showerror("Error", f"Restore failed: {error}")
+        elif success:
+            self.trade_tracker.clear_stats_cache()
+            self.full_reload()
+            messagebox.showinfo("Success", "Database restored successfully")
+        else:
+            messagebox.showerror("Error", "Failed to restore database")
     
     # Replaced open_ocr_scanner with open_ai_vision_scanner
+    @gui_action("Failed to open AI Vision scanner")
     def open_ocr_scanner(self):
         """Open AI Vision scanner window."""
         try:
-            # Check if Ollama is available before opening scanner
-            from backend.ai.ollama_client import OllamaClient
+            OllamaClient = self._OllamaClient
+            VisionScannerWindow = self._VisionScannerWindow
+            if OllamaClient is None or VisionScannerWindow is None:
+                # Preload still running or failed; import here so errors are reported
+                from backend.ai.ollama_client import OllamaClient
+                from frontend.views.ocr_scanner import VisionScannerWindow
             
-            # Quick availability check
-            test_client = OllamaClient()
-            if not test_client.is_available:
+            # Check if Ollama is available before opening scanner
+            # Quick availability check, reusing a recent probe result
+            now = time.monotonic()
+            if now - _ollama_probe_cache['t'] > OLLAMA_PROBE_TTL:
+                _ollama_probe_cache['ok'] = OllamaClient().is_available
+                _ollama_probe_cache['t'] = now
+            if not _ollama_probe_cache['ok']:
                 result = messagebox.askyesno(
                     "Ollama Not Running",
                     "Ollama AI service is not running or not installed.\n\n"
@@ -759,7 +1018,6 @@ TIPS:
                     return
             
             # Open the vision scanner
-            from frontend.views.ocr_scanner import VisionScannerWindow
             scanner = VisionScannerWindow(self.root, self)
             
         except ImportError as e:
@@ -772,94 +1030,107 @@ TIPS:
                 "• Pillow\n\n"
                 "Install with: pip install requests opencv-python Pillow"
             )
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to open AI Vision scanner: {e}")
-            self.logger.error(f"Vision scanner error: {e}")
     
+    @gui_action("Failed to open bulk download dialog")
     def bulk_download(self):
         """Download bulk card data from Scryfall."""
         from frontend.dialogs.bulk_download_dialog import BulkDownloadDialog
         
-        try:
-            dialog = BulkDownloadDialog(self.root, self.inventory_manager.scryfall_client)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to open bulk download dialog: {e}")
+        dialog = BulkDownloadDialog(self.root, self.inventory_manager.scryfall_client)
     
+    @gui_action("Failed to retrieve image cache stats")
     def show_image_cache_stats(self):
         """Show image cache statistics."""
-        try:
-            stats = self.image_manager.get_cache_stats()
-            
-            # The original code's `stats` dict had 'total_images' and 'last_cleaned'
-            # but the ImageManager's `get_cache_stats` returns 'total_files' and does not track 'last_cleaned'.
-            # Adjusting to match the actual ImageManager implementation.
-            message = (f"Image Cache Statistics:\n\n"
-                       f"Total images: {stats['total_files']}\n"
-                       f"Cache size: {stats['total_size_mb']:.2f} MB\n"
-                       f"Cache Directory: {stats['cache_directory']}")
-            messagebox.showinfo("Image Cache Stats", message)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to retrieve image cache stats: {e}")
+        stats = self.image_manager.get_cache_stats()
+        
+        # The original code's `stats` dict had 'total_images' and 'last_cleaned'
+        # but the ImageManager's `get_cache_stats` returns 'total_files' and does not track 'last_cleaned'.
+        # Adjusting to match the actual ImageManager implementation.
+        message = (f"Image Cache Statistics:\n\n"
+                   f"Total images: {stats['total_files']}\n"
+                   f"Cache size: {stats['total_size_mb']:.2f} MB\n"
+                   f"Cache Directory: {stats['cache_directory']}")
+        messagebox.showinfo("Image Cache Stats", message)
 
+    @gui_action("Failed to clear old images")
     def clear_old_images(self):
         """Clear old images from the cache."""
+        image_manager = self.image_manager
+        inventory_manager = self.inventory_manager
+        plan = {}
+        
+        def plan_worker():
+            # Cached images are keyed by image URL; the database works out which
+            # cache files no card in any collection refers to
+            try:
+                cache_files = image_manager.list_cache_files()
+                plan['stale_files'] = inventory_manager.get_unreferenced_image_files(cache_files)
+            except Exception as e:
+                plan['error'] = e
+        
+        # Work out what to delete while the user reads the confirmation
+        planner = threading.Thread(target=plan_worker, daemon=True)
+        planner.start()
+        
         result = messagebox.askyesno(
             "Confirm Clear Cache",
             "This will remove images not associated with cards in your current collections.\n"
             "Are you sure you want to proceed?"
         )
         if result:
-            try:
-                self.update_status("Clearing old images from cache...")
-                # Pass a list of all card IDs from all collections to image_manager
-                all_card_ids = []
-                collections = self.inventory_manager.get_collections()
-                for collection in collections:
-                    cards = self.inventory_manager.get_all_cards_in_collection(collection.id)
-                    all_card_ids.extend([card.scryfall_id for card in cards if card.scryfall_id])
-                
-                # Note: The original image_manager.clear_old_images does not take card_ids.
-                # Assuming this functionality will be added or is handled differently.
-                # For now, it will just clear based on `older_than_days`.
-                cleaned_count = self.image_manager.clear_cache() # Changed to clear_cache as per ImageManager
-                messagebox.showinfo("Clear Cache", f"Successfully cleared {cleaned_count} old images from cache.")
-                self.update_status(f"Cleared {cleaned_count} old images from cache.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to clear old images: {e}")
-                self.update_status("Failed to clear image cache.")
+            self.update_status("Clearing old images from cache...")
+            self.root.update_idletasks()  # Show status before the blocking cleanup
+            planner.join()
+            if 'error' in plan:
+                raise plan['error']
+            
+            cleaned_count = image_manager.remove_cache_files(plan['stale_files'])
+            messagebox.showinfo("Clear Cache", f"Successfully cleared {cleaned_count} old images from cache.")
+            self.update_status(f"Cleared {cleaned_count} old images from cache.")
     
+    @gui_action("Debug failed")
     def debug_image_cache(self):
         """Debug image cache contents."""
-        try:
-            cache_dir = self.image_manager.cache_dir
-            
-            if not os.path.exists(cache_dir):
-                messagebox.showinfo("Debug", f"Cache directory doesn't exist: {cache_dir}")
-                return
-            
-            files = os.listdir(cache_dir)
-            
-            message = f"Image Cache Debug:\n\n"
-            message += f"Cache Directory: {cache_dir}\n"
-            message += f"Files in cache: {len(files)}\n\n"
-            
-            if files:
-                message += "Recent files:\n"
-                for file in files[:10]:  # Show first 10 files
-                    file_path = os.path.join(cache_dir, file)
-                    file_size = os.path.getsize(file_path)
-                    message += f"  {file} ({file_size} bytes)\n"
+        image_manager = self.image_manager
+        cache_dir = image_manager.cache_dir
+        
+        def scan_worker():
+            # Scan off the main thread; results are shown via root.after
+            try:
+                if not os.path.exists(cache_dir):
+                    self.root.after(0, partial(messagebox.showinfo, "Debug", f"Cache directory doesn't exist: {cache_dir}"))
+                    return
                 
-                if len(files) > 10:
-                    message += f"  ... and {len(files) - 10} more files\n"
-            else:
-                message += "No cached images found."
-            
-            messagebox.showinfo("Image Cache Debug", message)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Debug failed: {e}")
+                # Single directory pass: describe the first 10 entries, count the rest
+                file_count = 0
+                recent_files = []
+                for entry in image_manager.list_cache_entries():
+                    if file_count < 10:  # Show first 10 files; only these are stat'ed
+                        recent_files.append(f"  {entry.name} ({entry.stat().st_size} bytes)")
+                    file_count += 1
+                
+                parts = ["Image Cache Debug:", "",
+                         f"Cache Directory: {cache_dir}",
+                         f"Files in cache: {file_count}", ""]
+                
+                if file_count:
+                    parts.append("Recent files:")
+                    parts.extend(recent_files)
+                    
+                    if file_count > 10:
+                        parts.append(f"  ... and {file_count - 10} more files")
+                else:
+                    parts.append("No cached images found.")
+                
+                message = "\n".join(parts)
+                self.root.after(0, partial(messagebox.showinfo, "Image Cache Debug", message))
+                
+            except Exception as e:
+                self.root.after(0, partial(messagebox.showerror, "Error", f"Debug failed: {e}"))
+        
+        threading.Thread(target=scan_worker, daemon=True).start()
 
+    @gui_action("Test download failed")
     def test_image_download(self):
         """Test image download with a known URL."""
         # Test with a known Magic card image URL
@@ -867,25 +1138,23 @@ TIPS:
         
         self.logger.info(f"Testing image download with URL: {test_url}")
         
-        def download_callback(success, cache_path):
+        def show_result(cache_path):
+            success = cache_path is not None
             message = f"Test download result:\n\nSuccess: {success}\nCache path: {cache_path}"
             if success and cache_path:
-                message += f"\nFile exists: {os.path.exists(cache_path)}"
-                if os.path.exists(cache_path):
-                    file_size = os.path.getsize(cache_path)
-                    message += f"\nFile size: {file_size} bytes"
+                try:
+                    file_size = os.stat(cache_path).st_size
+                except FileNotFoundError:
+                    message += "\nFile exists: False"
+                else:
+                    message += f"\nFile exists: True\nFile size: {file_size} bytes"
             
             messagebox.showinfo("Test Image Download", message)
         
-        self.image_manager.download_image(test_url, 'medium', download_callback)
+        # The future completes on a download thread; hand the result to Tk's thread
+        future = self.image_manager.download_image_async(test_url, 'medium')
+        future.add_done_callback(lambda f: self.post_to_ui(show_result, f.result()))
 
     def show_about(self):
         """Show about dialog."""
-        messagebox.showinfo(
-            "About MTG Collection Manager",
-            "MTG Collection Manager v1.0\n\n"
-            "A desktop application for managing Magic: The Gathering\n"
-            "card collections and deck building.\n\n"
-            "Built with Python and Tkinter\n"
-            "Card data provided by Scryfall API"
-        )
\ No newline at end of file
+        messagebox.showinfo("About MTG Collection Manager", _ABOUT_TEXT)
\ No newline at end of file
@@ -5,9 +5,21 @@ Card browser view for MTG Collection Manager.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, List, Optional
-import threading
-import os # Added for path checking
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Delay after the last keystroke before a search-as-you-type query runs
+SEARCH_DEBOUNCE_MS = 200
+
+# Quiet time after the results selection moves before the card details load
+SELECT_DEBOUNCE_MS = 120
+
+# Results rows added to the tree at a time; more are added as the view scrolls to the end
+RESULTS_PAGE_SIZE = 100
+
+def format_result_row(card: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Format a card as a search results row: (name, SET, collector number)."""
+    return (card['name'], card.get('set', '').upper(), card.get('collector_number') or '')
 
 class CardBrowser:
     """Card browser and search view."""
@@ -19,10 +31,47 @@ class CardBrowser:
         self.frame = ttk.Frame(parent)
         self.current_card_data = None
         
+        # Pending debounced search, and the token of the latest search; results
+        # from older searches are dropped when they arrive
+        self._search_after_id = None
+        self._search_token = 0
+        self._last_search_query = None  # Query of the last search run, to skip no-op keys
+        self._select_after_id = None  # Pending debounced on_card_select
+        
+        # One long-lived worker runs cache and API searches; a new search
+        # cancels the previous one if it has not started yet
+        self._search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='card-search')
+        self._current_future: Optional[Future] = None
+        
+        # Results rows by Scryfall card ID; a printing's row never changes
+        self._row_cache: Dict[str, Tuple[str, str, str]] = {}
+        
+        # Cards listed in the results tree, and how many of them have rows so far
+        self._result_cards: List[Dict[str, Any]] = []
+        self._rows_shown = 0
+        self._append_after_id = None
+        
+        # Card image placeholder, drawn once on first use and then reused
+        self._placeholder_photo = None
+        
         # Use the app's shared scryfall client instead of creating a new one
         # This prevents cache reloading
         
         self.setup_ui()
+        self.frame.bind('<Destroy>', self._on_destroy)
+    
+    def _on_destroy(self, event):
+        """Stop the search worker when the browser frame is destroyed."""
+        if event.widget is self.frame:
+            if self._current_future is not None:
+                self._current_future.cancel()
+            self._search_executor.shutdown(wait=False)
+    
+    def _submit_search(self, task: Callable[[], None]):
+        """Run a search task on the search worker, cancelling the pending one."""
+        if self._current_future is not None:
+            self._current_future.cancel()
+        self._current_future = self._search_executor.submit(task)
     
     def setup_ui(self):
         """Set up the card browser UI."""
@@ -55,6 +104,7 @@ class CardBrowser:
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         self.search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         self.search_entry.bind('<Return>', self.search_cards)
+        self.search_entry.bind('<KeyRelease>', self.on_search_key)
         
         ttk.Button(search_frame, text="Search", command=self.search_cards).pack(side=tk.LEFT, padx=5)
         
@@ -74,7 +124,8 @@ class CardBrowser:
         for color_code, color_name in colors:
             var = tk.BooleanVar()
             self.color_vars[color_code] = var
-            ttk.Checkbutton(color_frame, text=color_code, variable=var).pack(side=tk.LEFT, padx=2)
+            ttk.Checkbutton(color_frame, text=color_code, variable=var,
+                            command=self._update_advanced_filters).pack(side=tk.LEFT, padx=2)
         
         # Type filter
         type_frame = ttk.Frame(advanced_frame)
@@ -98,23 +149,36 @@ class CardBrowser:
         cmc_combo['values'] = ['', '0', '1', '2', '3', '4', '5', '6', '7+']
         cmc_combo.pack(side=tk.LEFT, padx=5)
         
+        # Keep the search filters in sync with the widgets instead of reading them per search
+        self._advanced_filters: Dict[str, Any] = {}
+        self.type_var.trace_add('write', self._update_advanced_filters)
+        self.cmc_var.trace_add('write', self._update_advanced_filters)
+        
         # Search results
         results_frame = ttk.LabelFrame(left_frame, text="Search Results")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Results listbox with scrollbar
-        listbox_frame = ttk.Frame(results_frame)
-        listbox_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Results tree with scrollbar; row iids are indexes into search_results
+        tree_frame = ttk.Frame(results_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.results_listbox = tk.Listbox(listbox_frame)
-        results_scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=self.results_listbox.yview)
-        self.results_listbox.configure(yscrollcommand=results_scrollbar.set)
+        self.results_tree = ttk.Treeview(tree_frame, columns=('set', 'number'),
+                                         show='tree headings', selectmode='browse', height=20)
+        self.results_tree.heading('#0', text='Name')
+        self.results_tree.heading('set', text='Set')
+        self.results_tree.heading('number', text='#')
+        self.results_tree.column('#0', width=200)
+        self.results_tree.column('set', width=50)
+        self.results_tree.column('number', width=50)
         
-        self.results_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.results_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=self._on_results_scroll)
         
-        self.results_listbox.bind('<<ListboxSelect>>', self.on_card_select)
-        self.results_listbox.bind('<Double-1>', self.add_selected_to_inventory)
+        self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.results_tree.bind('<<TreeviewSelect>>', self._schedule_select)
+        self.results_tree.bind('<Double-1>', self.add_selected_to_inventory)
         
         # Quick actions
         actions_frame = ttk.Frame(results_frame)
@@ -192,94 +256,158 @@ class CardBrowser:
         self.printings_label = ttk.Label(printings_frame, text="")
         self.printings_label.pack(padx=5, pady=5)
     
+    def on_search_key(self, event=None):
+        """Schedule a search once typing pauses, replacing any pending one."""
+        if event is not None and event.keysym == 'Return':
+            return  # Handled by the <Return> binding
+        
+        # Cursor movement, modifiers and copying leave the query unchanged
+        self._cancel_pending_search()
+        query = self.search_var.get().strip()
+        if query and query != self._last_search_query:
+            self._search_after_id = self.app.root.after(SEARCH_DEBOUNCE_MS, self._run_debounced_search)
+    
+    def _cancel_pending_search(self):
+        """Cancel a scheduled search-as-you-type query."""
+        if self._search_after_id is not None:
+            self.app.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+    
+    def _run_debounced_search(self):
+        """Run the search scheduled by on_search_key."""
+        self._search_after_id = None
+        if self.search_var.get().strip():
+            self.search_cards()
+    
     def search_cards(self, event=None):
         """Search for cards using local Scryfall cache."""
+        self._cancel_pending_search()
+        
         query = self.search_var.get().strip()
         if not query:
             messagebox.showwarning("Warning", "Please enter a search term.")
             return
         
+        # Only the newest search may update the results
+        self._last_search_query = query
+        self._search_token += 1
+        token = self._search_token
+        
+        # Read the filter widgets here; Tk variables belong to the main thread
+        filters = self.get_advanced_filters()
+        
         # Perform search in background thread using local cache
         self.app.update_status("Searching local cache...")
         
+        def show_results(results):
+            if token == self._search_token:
+                self.display_cached_search_results(results)
+        
+        def show_error(error):
+            if token == self._search_token:
+                messagebox.showerror("Error", f"Search failed: {error}")
+                self.app.update_status("Ready")
+        
         def search_thread():
             try:
-                # Use the cached search instead of API
-                results = self.app.scryfall_client.search_cards_in_cache(query, limit=50)
-                
-                # Filter results based on advanced search options
-                filtered_results = self.apply_advanced_filters(results)
+                # Use the cached search instead of API; the advanced filters are
+                # applied against the cache's search index before the limit
+                results = self.app.scryfall_client.search_cards_in_cache(query, limit=50, filters=filters)
                 
                 # Update UI in main thread
-                self.app.root.after(0, lambda: self.display_cached_search_results(filtered_results))
+                self.app.root.after(0, show_results, results)
                 
             except Exception as e:
-                self.app.root.after(0, lambda: messagebox.showerror("Error", f"Search failed: {e}"))
-                self.app.root.after(0, lambda: self.app.update_status("Ready"))
+                self.app.root.after(0, show_error, e)
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        self._submit_search(search_thread)
     
-    def apply_advanced_filters(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Apply advanced search filters to cached results."""
-        filtered = results
+    def get_advanced_filters(self) -> Dict[str, Any]:
+        """Get the advanced search options as search_cards_in_cache filters."""
+        return dict(self._advanced_filters)
+    
+    def _update_advanced_filters(self, *args):
+        """Recompute the search filters after an advanced search widget changes."""
+        filters = {}
         
-        # Apply color filters
-        selected_colors = [color for color, var in self.color_vars.items() if var.get()]
+        selected_colors = ''.join(color for color, var in self.color_vars.items() if var.get())
         if selected_colors:
-            filtered = [card for card in filtered 
-                        if any(color in card.get('colors', []) for color in selected_colors)]
+            filters['colors'] = selected_colors
         
-        # Apply type filter
-        type_filter = self.type_var.get()
-        if type_filter:
-            filtered = [card for card in filtered 
-                        if type_filter.lower() in card.get('type_line', '').lower()]
+        if self.type_var.get():
+            filters['type_line'] = self.type_var.get()
         
-        # Apply CMC filter
         cmc_filter = self.cmc_var.get()
-        if cmc_filter:
+        if cmc_filter == "7+":
+            filters['min_cmc'] = 7
+        elif cmc_filter:
             try:
-                if cmc_filter == "7+":
-                    filtered = [card for card in filtered 
-                                if card.get('cmc', 0) >= 7]
-                else:
-                    target_cmc = int(cmc_filter)
-                    filtered = [card for card in filtered 
-                                if card.get('cmc', 0) == target_cmc]
+                filters['cmc'] = int(cmc_filter)
             except ValueError:
                 pass   # Invalid CMC filter, ignore
         
-        return filtered
+        self._advanced_filters = filters
+    
+    def set_result_rows(self, cards: List[Dict[str, Any]]):
+        """Replace the results rows, adding only the first page of them."""
+        if self._append_after_id is not None:
+            self.results_tree.after_cancel(self._append_after_id)
+            self._append_after_id = None
+        self.results_tree.delete(*self.results_tree.get_children())
+        self._result_cards = cards
+        self._rows_shown = 0
+        self.append_result_rows()
+    
+    def append_result_rows(self):
+        """Add the next page of results rows, laying out and updating the scrollbar once at the end."""
+        self._append_after_id = None
+        start = self._rows_shown
+        page = self._result_cards[start:start + RESULTS_PAGE_SIZE]
+        if not page:
+            return
+        
+        tree = self.results_tree
+        tree.configure(yscrollcommand='', displaycolumns=())
+        try:
+            for i, (name, set_code, number) in enumerate(self.get_result_rows(page), start):
+                tree.insert('', tk.END, iid=str(i), text=name, values=(set_code, number))
+        finally:
+            tree.configure(yscrollcommand=self._on_results_scroll, displaycolumns='#all')
+        self._rows_shown = start + len(page)
+        self._on_results_scroll(*tree.yview())
+    
+    def _on_results_scroll(self, first, last):
+        """Update the scrollbar, and add more rows once the end of the results is in view."""
+        self.results_scrollbar.set(first, last)
+        if (float(last) >= 1.0 and self._rows_shown < len(self._result_cards)
+                and self._append_after_id is None):
+            self._append_after_id = self.results_tree.after_idle(self.append_result_rows)
     
     def display_cached_search_results(self, results: List[Dict[str, Any]]):
         """Display search results from cache."""
-        self.results_listbox.delete(0, tk.END)
+        self.set_result_rows(results)
         self.search_results = results
         
         if not results:
             self.app.update_status("No results found")
             return
         
-        self.app.logger.debug(f"=== CACHED SEARCH RESULTS ===")
-        if results:
-            first_card = results[0]
-            self.app.logger.debug(f"First card: {first_card.get('name')}")
-            self.app.logger.debug(f"Available keys: {list(first_card.keys())}")
-            
-            # Check for image fields
-            for key in first_card.keys():
-                if 'image' in key.lower():
-                    self.app.logger.debug(f"Image field '{key}': {first_card[key]}")
-        
-        for card in results:
-            display_text = f"{card['name']} ({card.get('set', '').upper()})"
-            if card.get('collector_number'):
-                display_text += f" #{card['collector_number']}"
-            
-            self.results_listbox.insert(tk.END, display_text)
-        
         self.app.update_status(f"Found {len(results)} cards")
     
+    def get_result_rows(self, cards: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        """Get the results row of each card, formatting each printing only once."""
+        row_cache = self._row_cache
+        rows = []
+        for card in cards:
+            card_id = card.get('id')
+            row = row_cache.get(card_id) if card_id else None
+            if row is None:
+                row = format_result_row(card)
+                if card_id:
+                    row_cache[card_id] = row
+            rows.append(row)
+        return rows
+    
     def search_cards_api_fallback(self, query: str):
         """Fallback to API search if cache search fails."""
         self.app.logger.info("Using API fallback search")
@@ -316,37 +444,43 @@ class CardBrowser:
                 self.app.root.after(0, lambda: messagebox.showerror("Error", f"API search failed: {e}"))
                 self.app.root.after(0, lambda: self.app.update_status("Ready"))
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        self._submit_search(search_thread)
     
     def display_api_search_results(self, result: Optional[Dict[str, Any]]):
         """Display API search results (original method)."""
-        self.results_listbox.delete(0, tk.END)
-        self.search_results = []
-        
         if not result or 'data' not in result:
+            self.set_result_rows([])
+            self.search_results = []
             self.app.update_status("No results found")
             return
         
         cards = result['data']
+        self.set_result_rows(cards)
         self.search_results = cards
         
-        for card in cards:
-            display_text = f"{card['name']} ({card.get('set', '').upper()})"
-            if card.get('collector_number'):
-                display_text += f" #{card['collector_number']}"
-            
-            self.results_listbox.insert(tk.END, display_text)
-        
         self.app.update_status(f"Found {len(cards)} cards")
     
+    def _schedule_select(self, event=None):
+        """Defer on_card_select until the selection settles (e.g. arrow-key scrolling)."""
+        if self._select_after_id is not None:
+            self.app.root.after_cancel(self._select_after_id)
+        self._select_after_id = self.app.root.after(SELECT_DEBOUNCE_MS, self.on_card_select)
+    
+    def _flush_pending_select(self):
+        """Apply a selection still waiting in _schedule_select, so actions see the selected card."""
+        if self._select_after_id is not None:
+            self.app.root.after_cancel(self._select_after_id)
+            self.on_card_select()
+    
     def on_card_select(self, event=None):
         """Handle card selection in results."""
-        selection = self.results_listbox.curselection()
+        self._select_after_id = None
+        selection = self.results_tree.selection()
         if selection and self.search_results:
-            card_index = selection[0]
+            card_index = int(selection[0])
             if card_index < len(self.search_results):
                 self.current_card_data = self.search_results[card_index]
-                self.app.logger.debug(f"Selected cached card: {self.current_card_data.get('name')}")
+                self.app.logger.debug("Selected cached card: %s", self.current_card_data.get('name'))
                 self.display_card_details(self.current_card_data)
     
     def display_card_details(self, card_data: Dict[str, Any]):
@@ -384,19 +518,24 @@ class CardBrowser:
         else:
             self.type_label.config(text="")
         
-        # Update set info
-        set_info = f"Set: {card_data.get('set', 'Unknown').upper()}"
-        if card_data.get('collector_number'):
-            set_info += f" #{card_data['collector_number']}"
+        # Update set info, joining the parts once
+        collector_number = card_data.get('collector_number')
+        if collector_number:
+            parts = [f"Set: {card_data.get('set', 'Unknown').upper()} #{collector_number}"]
+        else:
+            parts = [f"Set: {card_data.get('set', 'Unknown').upper()}"]
         
         # Add other useful info
-        if card_data.get('cmc') is not None:
-            set_info += f" | CMC: {card_data['cmc']}"
+        cmc = card_data.get('cmc')
+        if cmc is not None:
+            parts.append(f"CMC: {cmc}")
         
-        if card_data.get('power') is not None and card_data.get('toughness') is not None:
-            set_info += f" | P/T: {card_data['power']}/{card_data['toughness']}"
+        power = card_data.get('power')
+        toughness = card_data.get('toughness')
+        if power is not None and toughness is not None:
+            parts.append(f"P/T: {power}/{toughness}")
         
-        self.set_label.config(text=set_info)
+        self.set_label.config(text=" | ".join(parts))
         
         # Update oracle text
         oracle_text = card_data.get('oracle_text', '')
@@ -422,7 +561,7 @@ class CardBrowser:
     
     def load_card_image(self, card_data: Dict[str, Any]):
         """Load and display card image from cached data."""
-        self.app.logger.debug(f"=== Loading cached card image for: {card_data.get('name')} ===")
+        self.app.logger.debug("Loading cached card image for: %s", card_data.get('name'))
         
         image_url = None
         
@@ -433,7 +572,7 @@ class CardBrowser:
             image_url = (image_uris.get('normal') or 
                          image_uris.get('large') or 
                          image_uris.get('small'))
-            self.app.logger.debug(f"Found image_uris, selected: {image_url}")
+            self.app.logger.debug("Found image_uris, selected: %s", image_url)
         
         elif 'card_faces' in card_data and card_data['card_faces']:
             # Double-faced cards
@@ -443,42 +582,37 @@ class CardBrowser:
                 image_url = (image_uris.get('normal') or 
                              image_uris.get('large') or 
                              image_uris.get('small'))
-                self.app.logger.debug(f"Found double-faced card image: {image_url}")
+                self.app.logger.debug("Found double-faced card image: %s", image_url)
         
         if not image_url:
             self.app.logger.debug("No image URL found in cached data")
             # Show placeholder
-            placeholder = self.app.image_manager.create_placeholder_image((223, 311))
-            self.image_label.config(image=placeholder, text="")
-            self.image_label.image = placeholder
+            self.show_placeholder_image()
             return
         
-        self.app.logger.debug(f"Attempting to load image: {image_url}")
-        
-        # Try to load cached image immediately
-        tk_image = self.app.image_manager.load_image_for_tkinter(image_url, 'medium')
+        self.app.logger.debug("Attempting to load image: %s", image_url)
         
-        if tk_image:
+        # Load cached images immediately; repeat visits hit the in-memory LRU
+        if self.app.image_manager.is_image_cached(image_url, 'medium'):
+            tk_image = self.app.image_manager.load_image_for_tkinter(image_url, 'medium')
             self.image_label.config(image=tk_image, text="")
             self.image_label.image = tk_image
             self.app.logger.debug("Image loaded from cache successfully")
         else:
             # Show placeholder and start download
             self.app.logger.debug("Image not in local cache, downloading...")
-            placeholder = self.app.image_manager.create_placeholder_image((223, 311))
-            self.image_label.config(image=placeholder, text="")
-            self.image_label.image = placeholder
+            self.show_placeholder_image()
             
-            # Download image in background
+            # Download image in background; runs on the download worker thread
             def image_downloaded(success, cache_path):
-                self.app.logger.debug(f"Image download result: success={success}, path={cache_path}")
-                if success and cache_path and os.path.exists(cache_path):
+                self.app.logger.debug("Image download result: success=%s, path=%s", success, cache_path)
+                # Decode here so only the PhotoImage is created on the main thread
+                pil_image = self.app.image_manager.decode_cached_image(image_url, 'medium') if success else None
+                if pil_image is not None:
                     def update_image():
                         try:
-                            # Load the downloaded image
-                            from PIL import Image, ImageTk
-                            pil_image = Image.open(cache_path)
-                            new_image = ImageTk.PhotoImage(pil_image)
+                            # Keep the new image in the image manager's LRU
+                            new_image = self.app.image_manager.cache_tk_image(image_url, 'medium', pil_image)
                             
                             self.image_label.config(image=new_image, text="")
                             self.image_label.image = new_image
@@ -493,6 +627,13 @@ class CardBrowser:
             
             self.app.image_manager.download_image(image_url, 'medium', image_downloaded)
     
+    def show_placeholder_image(self):
+        """Show the card image placeholder, creating it the first time."""
+        if self._placeholder_photo is None:
+            self._placeholder_photo = self.app.image_manager.create_placeholder_image((223, 311))
+        self.image_label.config(image=self._placeholder_photo, text="")
+        self.image_label.image = self._placeholder_photo
+    
     def refresh_current_image(self):
         """Refresh the current card image - for debugging."""
         if hasattr(self, 'current_card_data') and self.current_card_data:
@@ -503,48 +644,65 @@ class CardBrowser:
 
     def add_selected_to_inventory(self, event=None):
         """Add selected card to inventory."""
+        self._flush_pending_select()
         if not self.current_card_data:
             messagebox.showwarning("Warning", "Please select a card first.")
             return
         
-        # Open quantity dialog
-        dialog = tk.Toplevel(self.app.root)
-        dialog.title("Add to Inventory")
-        dialog.geometry("350x280") # Made taller and wider
-        dialog.transient(self.app.root)
-        dialog.grab_set()
-        dialog.resizable(False, False)
+        # The dialog is built once and hidden on close; reopening only resets it
+        dialog = getattr(self, '_add_dialog', None)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_add_dialog()
+        
+        card_name = self.current_card_data.get('name', 'Unknown Card')
+        self._add_header_label.config(text=f"Add '{card_name}' to inventory:")
+        self._add_quantity_var.set(1)
+        self._add_foil_var.set(False)
+        self._add_condition_var.set("Near Mint")
         
         # Center the dialog
-        dialog.update_idletasks()
         x = (dialog.winfo_screenwidth() // 2) - (350 // 2)
         y = (dialog.winfo_screenheight() // 2) - (280 // 2)
         dialog.geometry(f"350x280+{x}+{y}")
         
+        dialog.deiconify()
+        dialog.grab_set()
+        
+        # Focus on quantity field
+        self._add_quantity_spin.focus()
+    
+    def _build_add_dialog(self) -> tk.Toplevel:
+        """Build the (initially hidden) Add to Inventory dialog."""
+        dialog = tk.Toplevel(self.app.root)
+        dialog.withdraw()
+        dialog.title("Add to Inventory")
+        dialog.geometry("350x280") # Made taller and wider
+        dialog.transient(self.app.root)
+        dialog.resizable(False, False)
+        
         # Main container
         main_frame = ttk.Frame(dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Card name header
-        card_name = self.current_card_data.get('name', 'Unknown Card')
-        header_label = ttk.Label(main_frame, text=f"Add '{card_name}' to inventory:", 
-                                 font=('TkDefaultFont', 10, 'bold'))
-        header_label.pack(pady=(0, 20))
+        self._add_header_label = ttk.Label(main_frame, text="", 
+                                           font=('TkDefaultFont', 10, 'bold'))
+        self._add_header_label.pack(pady=(0, 20))
         
         # Quantity frame
         quantity_frame = ttk.Frame(main_frame)
         quantity_frame.pack(fill=tk.X, pady=(0, 15))
         
         ttk.Label(quantity_frame, text="Quantity:", width=12).pack(side=tk.LEFT)
-        quantity_var = tk.IntVar(value=1)
-        quantity_spin = ttk.Spinbox(quantity_frame, from_=1, to=100, textvariable=quantity_var, width=10)
-        quantity_spin.pack(side=tk.LEFT, padx=(10, 0))
+        self._add_quantity_var = quantity_var = tk.IntVar(value=1)
+        self._add_quantity_spin = ttk.Spinbox(quantity_frame, from_=1, to=100, textvariable=quantity_var, width=10)
+        self._add_quantity_spin.pack(side=tk.LEFT, padx=(10, 0))
         
         # Foil frame
         foil_frame = ttk.Frame(main_frame)
         foil_frame.pack(fill=tk.X, pady=(0, 15))
         
-        foil_var = tk.BooleanVar()
+        self._add_foil_var = foil_var = tk.BooleanVar()
         foil_check = ttk.Checkbutton(foil_frame, text="Foil", variable=foil_var)
         foil_check.pack(side=tk.LEFT)
         
@@ -553,7 +711,7 @@ class CardBrowser:
         condition_frame.pack(fill=tk.X, pady=(0, 20))
         
         ttk.Label(condition_frame, text="Condition:", width=12).pack(side=tk.LEFT)
-        condition_var = tk.StringVar(value="Near Mint")
+        self._add_condition_var = condition_var = tk.StringVar(value="Near Mint")
         condition_combo = ttk.Combobox(condition_frame, textvariable=condition_var,
                                          values=["Mint", "Near Mint", "Lightly Played",
                                                          "Moderately Played", "Heavily Played", "Damaged"],
@@ -564,6 +722,10 @@ class CardBrowser:
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, side=tk.BOTTOM)
         
+        def close():
+            dialog.grab_release()
+            dialog.withdraw()
+        
         def add_card():
             try:
                 # Get or create card in database
@@ -579,7 +741,7 @@ class CardBrowser:
                 )
                 
                 if success:
-                    dialog.destroy()
+                    close()
                     self.app.inventory_view.refresh()
                     self.app.update_status(f"Added {quantity_var.get()}x {self.current_card_data['name']} to inventory")
                 else:
@@ -588,26 +750,24 @@ class CardBrowser:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add card: {e}")
         
-        def cancel():
-            dialog.destroy()
-        
         # Buttons
         add_button = ttk.Button(button_frame, text="Add to Inventory", command=add_card)
         add_button.pack(side=tk.LEFT, padx=(0, 10))
         
-        cancel_button = ttk.Button(button_frame, text="Cancel", command=cancel)
+        cancel_button = ttk.Button(button_frame, text="Cancel", command=close)
         cancel_button.pack(side=tk.LEFT)
         
         # Bind events
         dialog.bind('<Return>', lambda e: add_card())
-        dialog.bind('<Escape>', lambda e: cancel())
-        dialog.protocol("WM_DELETE_WINDOW", cancel)
+        dialog.bind('<Escape>', lambda e: close())
+        dialog.protocol("WM_DELETE_WINDOW", close)
         
-        # Focus on quantity field
-        quantity_spin.focus()
+        self._add_dialog = dialog
+        return dialog
     
     def add_selected_to_deck(self):
         """Add selected card to a deck."""
+        self._flush_pending_select()
         if not self.current_card_data:
             messagebox.showwarning("Warning", "Please select a card first.")
             return
@@ -6,6 +6,54 @@ Deck view for MTG Collection Manager.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Any, List
+import threading
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+
+# Card rows added to a section tree at a time; more are added as the tree scrolls to the end
+DECK_PAGE_SIZE = 100
+
+# Delay after the last filter keystroke before the deck contents are refreshed
+FILTER_DEBOUNCE_MS = 150
+
+# Sort options -> key over the fields precomputed by DeckView.get_deck_cards
+SORT_KEYS = {
+    "name": itemgetter('_name_lc'),
+    "cmc": itemgetter('_cmc'),
+    "type": itemgetter('_type_lc'),
+    "color": itemgetter('_color_key'),
+}
+
+# Position of each color in WUBRG order, for the color sort key
+COLOR_ORDER = {color: i for i, color in enumerate('WUBRG')}
+
+# Display order of the statistics color distribution
+STAT_COLORS = (*COLOR_ORDER, 'Colorless')
+
+# Display names of the deck sections
+SECTION_NAMES = {
+    "main": "Main Deck",
+    "sideboard": "Sideboard",
+    "commander": "Commander",
+}
+
+def summarize_deck(deck_cards: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Get the deck header totals (as in DeckBuilder.get_deck_stats) from already-loaded deck cards."""
+    main_deck_count = sum(card['quantity'] for card in deck_cards['main'])
+    total_cards = (main_deck_count
+                   + sum(card['quantity'] for card in deck_cards['commander'])
+                   + sum(card['quantity'] for card in deck_cards['sideboard']))
+    
+    # Average over deck rows with a known CMC, like SQL AVG(c.cmc)
+    cmcs = [card['cmc'] for cards in deck_cards.values() for card in cards if card['cmc'] is not None]
+    avg_cmc = sum(cmcs) / len(cmcs) if cmcs else 0
+    
+    return {
+        'total_cards': total_cards,
+        'main_deck_count': main_deck_count,
+        'avg_cmc': avg_cmc,
+    }
 
 class DeckView:
     """Deck management view."""
@@ -16,6 +64,32 @@ class DeckView:
         self.app = app
         self.frame = ttk.Frame(parent)
         self.current_deck_id = None
+        self._filter_after_id = None  # Pending debounced filter refresh
+        self._deck_by_id: Dict[int, Dict[str, Any]] = {}  # Filled by populate_deck_list
+        self._deck_index_by_id: Dict[int, int] = {}
+        
+        # Cards of the current deck, keyed by (deck ID, version); the version is
+        # bumped whenever this view or the app changes deck contents
+        self._deck_cards_cache: Dict[tuple, Dict[str, List[Dict[str, Any]]]] = {}
+        self._deck_version = 0
+        self._sorted_cards: Dict[tuple, List[Dict[str, Any]]] = {}  # (section, sort option) -> cards
+        self._shown_state = None  # _contents_state() of the last show_deck_contents
+        self._loading_key = None  # (deck ID, version) being loaded by the worker, if any
+        
+        # Sorted and filtered cards of each section, and how many have rows so far
+        self._section_rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._rows_shown: Dict[str, int] = {}
+        # Rows currently in each section tree: iid -> (text, values), in tree order
+        self._rendered_rows: Dict[str, Dict[str, tuple]] = {}
+        self._row_order: Dict[str, List[str]] = {}
+        self._append_after_ids: Dict[str, str] = {}
+        self._section_scrollbars: Dict[str, ttk.Scrollbar] = {}
+        
+        # Card list trees by section; the commander and sideboard lists are
+        # built the first time their tab is shown
+        self._trees: Dict[str, ttk.Treeview] = {}
+        self._section_frames: Dict[str, ttk.Frame] = {}
+        self._active_section = "main"  # Section the shared context menu acts on
         
         self.setup_ui()
         self.refresh()
@@ -31,6 +105,9 @@ class DeckView:
         
         # Right panel - Deck contents
         self.create_deck_contents_panel()
+        
+        # One context menu shared by all section lists
+        self.create_enhanced_context_menu()
     
     def create_deck_list_panel(self):
         """Create the deck list panel."""
@@ -117,12 +194,17 @@ class DeckView:
         # Commander tab
         self.commander_frame = ttk.Frame(self.deck_notebook)
         self.deck_notebook.add(self.commander_frame, text="Commander")
-        self.create_enhanced_card_list(self.commander_frame, "commander")
         
         # Sideboard tab
         self.sideboard_frame = ttk.Frame(self.deck_notebook)
         self.deck_notebook.add(self.sideboard_frame, text="Sideboard")
-        self.create_enhanced_card_list(self.sideboard_frame, "sideboard")
+        
+        self._section_frames = {
+            "main": self.main_frame,
+            "commander": self.commander_frame,
+            "sideboard": self.sideboard_frame,
+        }
+        self.deck_notebook.bind('<<NotebookTabChanged>>', self.on_deck_tab_changed)
         
         # Add card frame
         add_card_frame = ttk.Frame(right_frame)
@@ -168,53 +250,66 @@ class DeckView:
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
+        self._section_scrollbars[section] = scrollbar
         
         # Pack
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Store reference
-        setattr(self, f"{section}_tree", tree)
-        
-        # Enhanced context menu
-        self.create_enhanced_context_menu(tree, section)
+        self._trees[section] = tree
+        self._restore_section_scrolling(section)
         
         # Bind events
         tree.bind('<Double-1>', lambda e: self.edit_card_quantity(section))
         tree.bind('<Delete>', lambda e: self.remove_card_from_deck(section))
         tree.bind('<Button-3>', lambda e: self.show_enhanced_context_menu(e, section))
 
-    def create_enhanced_context_menu(self, tree, section):
-        """Create enhanced context menu for deck cards."""
+    def on_deck_tab_changed(self, event=None):
+        """Build and fill a section's card list the first time its tab is shown."""
+        selected = self.deck_notebook.select()
+        for section, frame in self._section_frames.items():
+            if str(frame) == selected:
+                if section not in self._trees:
+                    self.create_enhanced_card_list(frame, section)
+                    if self.current_deck_id:
+                        try:
+                            cards = self.get_deck_cards()[section]
+                            self.set_section_rows(section, self.apply_sort_and_filter(cards, section))
+                        except Exception as e:
+                            messagebox.showerror("Error", f"Failed to load deck contents: {e}")
+                break
+    
+    def create_enhanced_context_menu(self):
+        """Create enhanced context menu for deck cards; commands act on the section it was opened in."""
         context_menu = tk.Menu(self.frame, tearoff=0)
         
         context_menu.add_command(label="Edit Quantity", 
-                                  command=lambda: self.edit_card_quantity(section))
+                                  command=lambda: self.edit_card_quantity(self._active_section))
         context_menu.add_command(label="Move to Other Section", 
-                                  command=lambda: self.move_card_between_sections(section))
+                                  command=lambda: self.move_card_between_sections(self._active_section))
         context_menu.add_separator()
         context_menu.add_command(label="Remove from Deck", 
-                                  command=lambda: self.remove_card_from_deck(section))
+                                  command=lambda: self.remove_card_from_deck(self._active_section))
         context_menu.add_separator()
         context_menu.add_command(label="View Card Details", 
-                                  command=lambda: self.view_deck_card_details(section))
+                                  command=lambda: self.view_deck_card_details(self._active_section))
         
         # Store reference to context menu
-        setattr(self, f"{section}_context_menu", context_menu)
+        self.context_menu = context_menu
 
     def show_enhanced_context_menu(self, event, section):
         """Show enhanced context menu."""
-        tree = getattr(self, f"{section}_tree")
+        tree = self._trees[section]
         item = tree.identify_row(event.y)
         if item:
             tree.selection_set(item)
-            context_menu = getattr(self, f"{section}_context_menu")
-            context_menu.post(event.x_root, event.y_root)
+            self._active_section = section
+            self.context_menu.post(event.x_root, event.y_root)
 
     def move_card_between_sections(self, current_section):
         """Move a card between deck sections."""
-        tree = getattr(self, f"{current_section}_tree")
+        tree = self._trees[current_section]
         selection = tree.selection()
         
         if not selection:
@@ -222,7 +317,7 @@ class DeckView:
             return
         
         item = selection[0]
-        deck_card_id = int(tree.item(item)['tags'][0])
+        deck_card_id = int(item)  # Row iids are deck card IDs
         
         # Get card data
         card_data = self.app.deck_builder.get_deck_card_by_id(deck_card_id)
@@ -265,6 +360,7 @@ class DeckView:
                         move_quantity, is_commander, is_sideboard
                     )
                 
+                self.invalidate_deck_cards()
                 if success:
                     self.refresh_deck_contents()
                     section_name = self.format_section_name(target_section)
@@ -286,111 +382,202 @@ class DeckView:
 
     def format_section_name(self, section: str) -> str:
         """Format section name for display."""
-        if section == "main":
-            return "Main Deck"
-        elif section == "sideboard":
-            return "Sideboard"
-        elif section == "commander":
-            return "Commander"
-        else:
-            return section.title()
+        return SECTION_NAMES.get(section) or section.title()
 
+    def _contents_state(self) -> tuple:
+        """Get the deck, deck version, sort option and filter text the card lists depend on."""
+        return (self.current_deck_id, self._deck_version,
+                self.sort_var.get(), self.filter_var.get().lower())
+    
+    def _refresh_if_changed(self):
+        """Refresh the deck contents unless they already reflect the current sort and filter."""
+        if self.current_deck_id and self._contents_state() != self._shown_state:
+            self.refresh_deck_contents()
+    
     def on_sort_change(self, event=None):
         """Handle sort option change."""
-        if self.current_deck_id:
-            self.refresh_deck_contents()
+        self._refresh_if_changed()
 
     def on_filter_change(self, event=None):
-        """Handle filter change."""
+        """Handle filter change, refreshing once typing pauses."""
+        self._cancel_pending_filter()
         if self.current_deck_id:
-            self.refresh_deck_contents()
+            self._filter_after_id = self.frame.after(FILTER_DEBOUNCE_MS, self._run_debounced_filter)
+    
+    def _cancel_pending_filter(self):
+        """Cancel a scheduled filter refresh."""
+        if self._filter_after_id is not None:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+    
+    def _run_debounced_filter(self):
+        """Run the refresh scheduled by on_filter_change."""
+        self._filter_after_id = None
+        self._refresh_if_changed()  # Keys that do not edit the text change nothing
 
     def clear_filter(self):
         """Clear the card filter."""
         self.filter_var.set("")
-        if self.current_deck_id:
-            self.refresh_deck_contents()
+        self._refresh_if_changed()
 
-    def apply_sort_and_filter(self, cards):
-        """Apply sorting and filtering to card list."""
-        # Apply filter
-        filter_text = self.filter_var.get().lower()
-        if filter_text:
-            cards = [card for card in cards if filter_text in card['name'].lower()]
-        
-        # Apply sort
+    def apply_sort_and_filter(self, cards, section=None):
+        """Apply sorting and filtering to card list; a section's sorted order is reused until the deck changes."""
+        # Apply sort, using the keys precomputed by get_deck_cards
         sort_by = self.sort_var.get()
-        if sort_by == "name":
-            cards.sort(key=lambda x: x['name'].lower())
-        elif sort_by == "cmc":
-            cards.sort(key=lambda x: x.get('cmc', 0))
-        elif sort_by == "type":
-            cards.sort(key=lambda x: x.get('type_line', '').lower())
-        elif sort_by == "color":
-            cards.sort(key=lambda x: x.get('colors', ''))
-        
-        return cards
+        presorted = self._sorted_cards.get((section, sort_by)) if section else None
+        if presorted is None:
+            sort_key = SORT_KEYS.get(sort_by)
+            presorted = sorted(cards, key=sort_key) if sort_key else list(cards)
+            if section:
+                self._sorted_cards[(section, sort_by)] = presorted
+        
+        # Apply filter; with no filter text the sorted list is used as is
+        filter_text = self.filter_var.get().lower()
+        if not filter_text:
+            return presorted
+        return [card for card in presorted if filter_text in card['_name_lc']]
+    
+    def get_deck_cards(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the current deck's cards by section, querying only after a change."""
+        key = (self.current_deck_id, self._deck_version)
+        deck_cards = self._deck_cards_cache.get(key)
+        if deck_cards is None:
+            deck_cards = self._query_deck_cards(self.current_deck_id)
+            self._deck_cards_cache = {key: deck_cards}
+            self._sorted_cards = {}
+        return deck_cards
+    
+    def _query_deck_cards(self, deck_id: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Query a deck's cards and add their sort and filter keys; safe to call from any thread."""
+        deck_cards = self.app.deck_builder.get_deck_cards(deck_id)
+        
+        # Precompute the sort, filter and statistics keys once per query
+        # rather than per comparison or per statistics dialog
+        for cards in deck_cards.values():
+            for card in cards:
+                type_line = card.get('type_line') or ''
+                card['_name_lc'] = card['name'].lower()
+                card['_type_lc'] = type_line.lower()
+                card['_primary_type'] = type_line.partition(' ')[0]
+                card['_cmc'] = card.get('cmc') or 0
+                # Colors are stored as 'W,U'; sort colorless first, then by WUBRG positions
+                colors = tuple(color.strip() for color in (card.get('colors') or '').split(',') if color.strip())
+                card['_colors'] = colors
+                card['_color_key'] = tuple(sorted(COLOR_ORDER.get(color, len(COLOR_ORDER)) for color in colors))
+        
+        return deck_cards
+    
+    def invalidate_deck_cards(self):
+        """Mark the cached deck cards stale after deck contents change."""
+        self._deck_version += 1
+        self._deck_cards_cache = {}
+        self._sorted_cards = {}
     
     def refresh(self):
         """Refresh the deck list and current deck contents."""
+        self.invalidate_deck_cards()
         self.refresh_deck_list()
         if self.current_deck_id:
             self.refresh_deck_contents()
     
+    def populate(self, decks: List[Dict[str, Any]]):
+        """Refresh the view from an already-fetched deck list."""
+        self.invalidate_deck_cards()
+        self.populate_deck_list(decks)
+        if self.current_deck_id:
+            self.refresh_deck_contents()
+    
     def refresh_deck_list(self):
         """Refresh the deck list."""
-        self.deck_listbox.delete(0, tk.END)
-        
         try:
             decks = self.app.deck_builder.get_decks(self.app.current_collection_id)
-            
-            for deck in decks:
-                display_text = f"{deck['name']} ({deck['format'] or 'No Format'})"
-                if deck['is_commander']:
-                    display_text += " [Commander]"
-                
-                self.deck_listbox.insert(tk.END, display_text)
-                # Store deck ID as a tag (we'll need to track this separately)
-            
-            # Store deck data for reference
-            self.deck_data = decks
-            
         except Exception as e:
+            self.deck_listbox.delete(0, tk.END)
             messagebox.showerror("Error", f"Failed to load decks: {e}")
+            return
+        
+        self.populate_deck_list(decks)
+    
+    def populate_deck_list(self, decks: List[Dict[str, Any]]):
+        """Fill the deck list from already-fetched deck rows."""
+        self.deck_listbox.delete(0, tk.END)
+        
+        display_texts = tuple(
+            f"{deck['name']} ({deck['format'] or 'No Format'})"
+            f"{' [Commander]' if deck['is_commander'] else ''}"
+            for deck in decks
+        )
+        
+        # One Tcl call for all rows; deck IDs are looked up by listbox index in deck_data
+        if display_texts:
+            self.deck_listbox.insert(tk.END, *display_texts)
+        
+        # Store deck data for reference, with lookups by deck ID
+        self.deck_data = decks
+        self._deck_by_id = {deck['id']: deck for deck in decks}
+        self._deck_index_by_id = {deck['id']: i for i, deck in enumerate(decks)}
     
     def refresh_deck_contents(self):
         """Refresh the contents of the current deck with sorting and filtering."""
+        self._cancel_pending_filter()  # This refresh already applies the filter
         if not self.current_deck_id:
             return
         
+        # Sort and filter changes reuse the last query; after a deck change the
+        # query and sort run on a worker, and only the current deck's load is shown.
+        # Changes made while that load runs are applied when it arrives
+        key = (self.current_deck_id, self._deck_version)
+        if key in self._deck_cards_cache:
+            self.show_deck_contents()
+            return
+        if key == self._loading_key:
+            return
+        
+        self._loading_key = key
+        threading.Thread(target=self._load_deck_contents,
+                         args=(key, self.sort_var.get()),
+                         daemon=True).start()
+    
+    def _load_deck_contents(self, key: tuple, sort_by: str):
+        """Query and presort a deck's cards on a worker thread, then show them on the Tk thread."""
         try:
-            # Get deck cards
-            deck_cards = self.app.deck_builder.get_deck_cards(self.current_deck_id)
-            
-            # Clear existing trees
-            for section in ['main', 'commander', 'sideboard']:
-                tree = getattr(self, f"{section}_tree")
-                for item in tree.get_children():
-                    tree.delete(item)
+            deck_cards = self._query_deck_cards(key[0])
+            sort_key = SORT_KEYS.get(sort_by)
+            presorted = {
+                (section, sort_by): sorted(cards, key=sort_key) if sort_key else list(cards)
+                for section, cards in deck_cards.items()
+            }
+            error = None
+        except Exception as e:
+            deck_cards, presorted, error = None, None, e
+        self.app.post_to_ui(self._deck_contents_loaded, key, deck_cards, presorted, error)
+    
+    def _deck_contents_loaded(self, key: tuple, deck_cards, presorted, error: Exception = None):
+        """Show deck cards loaded by _load_deck_contents unless another deck or version is now current."""
+        if key == self._loading_key:
+            self._loading_key = None
+        if key != (self.current_deck_id, self._deck_version):
+            return
+        if error:
+            messagebox.showerror("Error", f"Failed to load deck contents: {error}")
+            return
+        
+        self._deck_cards_cache = {key: deck_cards}
+        self._sorted_cards = presorted
+        self.show_deck_contents()
+    
+    def show_deck_contents(self):
+        """Fill the section trees from the cached deck cards with sorting and filtering."""
+        try:
+            deck_cards = self.get_deck_cards()
             
-            # Populate trees with sorting and filtering
+            # Populate trees with sorting and filtering; only the first page of
+            # each section gets rows until its tree is scrolled, and sections
+            # whose tab has not been opened yet are filled when it is
             for section, cards in deck_cards.items():
-                tree = getattr(self, f"{section}_tree")
-                
-                # Apply sort and filter
-                sorted_filtered_cards = self.apply_sort_and_filter(cards)
-                
-                for card in sorted_filtered_cards:
-                    tree.insert('', tk.END,
-                        text=card['name'],
-                        values=(
-                            card['quantity'],
-                            card['mana_cost'] or '',
-                            card['type_line'] or '',
-                            card['cmc'] or 0
-                        ),
-                        tags=(str(card['id']),)
-                    )
+                if section in self._trees:
+                    self.set_section_rows(section, self.apply_sort_and_filter(cards, section))
+            self._shown_state = self._contents_state()
             
             # Update deck info
             self.update_deck_info()
@@ -398,21 +585,118 @@ class DeckView:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load deck contents: {e}")
     
+    def set_section_rows(self, section: str, cards: List[Dict[str, Any]]):
+        """
+        Update a section's card rows to match cards, touching only rows that changed.
+        
+        Rows are keyed by deck card ID (the row iid). As many rows stay shown
+        as before, and at least the first page.
+        """
+        tree = self._trees[section]
+        after_id = self._append_after_ids.pop(section, None)
+        if after_id is not None:
+            tree.after_cancel(after_id)
+        
+        shown = cards[:max(DECK_PAGE_SIZE, self._rows_shown.get(section, 0))]
+        rendered = self._rendered_rows.get(section, {})
+        new_rendered = {}
+        new_order = []
+        for card in shown:
+            iid = str(card['id'])
+            new_rendered[iid] = self._deck_row(card)
+            new_order.append(iid)
+        
+        # Existing rows only need moving when their relative order changed
+        old_order = [iid for iid in self._row_order.get(section, ()) if iid in new_rendered]
+        reorder = old_order != [iid for iid in new_order if iid in rendered]
+        
+        # Update with columns hidden and scrolling detached so the tree lays out once
+        tree.configure(yscrollcommand='', displaycolumns=())
+        try:
+            # Drop rows for cards that are gone or no longer pass the filter
+            stale = [iid for iid in rendered if iid not in new_rendered]
+            if stale:
+                tree.delete(*stale)
+            
+            for index, iid in enumerate(new_order):
+                name, values = new_rendered[iid]
+                previous = rendered.get(iid)
+                if previous is None:
+                    tree.insert('', index, iid=iid, text=name, values=values)
+                    continue
+                if previous != new_rendered[iid]:
+                    tree.item(iid, text=name, values=values)
+                if reorder:
+                    tree.move(iid, '', index)
+        finally:
+            self._restore_section_scrolling(section)
+        
+        self._section_rows[section] = cards
+        self._rendered_rows[section] = new_rendered
+        self._row_order[section] = new_order
+        self._rows_shown[section] = len(shown)
+        self._on_section_scroll(section, *tree.yview())
+    
+    def append_section_rows(self, section: str):
+        """Add the next page of a section's card rows."""
+        self._append_after_ids.pop(section, None)
+        start = self._rows_shown[section]
+        page = self._section_rows[section][start:start + DECK_PAGE_SIZE]
+        if not page:
+            return
+        
+        tree = self._trees[section]
+        rendered = self._rendered_rows[section]
+        order = self._row_order[section]
+        tree.configure(yscrollcommand='', displaycolumns=())
+        try:
+            for card in page:
+                iid = str(card['id'])
+                row = self._deck_row(card)
+                tree.insert('', tk.END, iid=iid, text=row[0], values=row[1])
+                rendered[iid] = row
+                order.append(iid)
+        finally:
+            self._restore_section_scrolling(section)
+        self._rows_shown[section] = start + len(page)
+        self._on_section_scroll(section, *tree.yview())
+    
+    def _restore_section_scrolling(self, section: str):
+        """Show a section tree's columns and reattach its scrollbar after a bulk update."""
+        self._trees[section].configure(
+            yscrollcommand=lambda first, last: self._on_section_scroll(section, first, last),
+            displaycolumns='#all')
+    
+    @staticmethod
+    def _deck_row(card: Dict[str, Any]) -> tuple:
+        """Get the (text, values) shown for a deck card row."""
+        return (card['name'], (
+            card['quantity'],
+            card['mana_cost'] or '',
+            card['type_line'] or '',
+            card['cmc'] or 0
+        ))
+    
+    def _on_section_scroll(self, section: str, first, last):
+        """Update a section's scrollbar, and add more rows once the end of its tree is in view."""
+        self._section_scrollbars[section].set(first, last)
+        if (float(last) >= 1.0
+                and self._rows_shown.get(section, 0) < len(self._section_rows.get(section, ()))
+                and section not in self._append_after_ids):
+            tree = self._trees[section]
+            self._append_after_ids[section] = tree.after_idle(self.append_section_rows, section)
+    
     def update_deck_info(self):
         """Update deck information display."""
         if not self.current_deck_id:
             return
         
         try:
-            # Get deck stats
-            stats = self.app.deck_builder.get_deck_stats(self.current_deck_id)
+            # Get deck stats from the cached deck cards rather than another query
+            stats = summarize_deck(self.get_deck_cards())
             
             # Find current deck info
-            current_deck = None
-            for deck in self.deck_data:
-                if deck['id'] == self.current_deck_id:
-                    current_deck = deck
-                    break
+            current_deck = self._deck_by_id.get(self.current_deck_id)
             
             if current_deck:
                 info_text = (f"Name: {current_deck['name']} | "
@@ -434,6 +718,7 @@ class DeckView:
             deck_index = selection[0]
             if deck_index < len(self.deck_data):
                 self.current_deck_id = self.deck_data[deck_index]['id']
+                self._rows_shown.clear()  # Start the new deck at its first page
                 self.refresh_deck_contents()
     
     def new_deck(self):
@@ -499,13 +784,12 @@ class DeckView:
                 if new_deck_id:
                     self.refresh_deck_list()
                     # Select the new deck
-                    for i, deck in enumerate(self.deck_data):
-                        if deck['id'] == new_deck_id:
-                            self.deck_listbox.selection_clear(0, tk.END)
-                            self.deck_listbox.selection_set(i)
-                            self.current_deck_id = new_deck_id
-                            self.refresh_deck_contents()
-                            break
+                    i = self._deck_index_by_id.get(new_deck_id)
+                    if i is not None:
+                        self.deck_listbox.selection_clear(0, tk.END)
+                        self.deck_listbox.selection_set(i)
+                        self.current_deck_id = new_deck_id
+                        self.refresh_deck_contents()
                     
                     self.app.update_status(f"Copied deck to '{copy_options['name']}'")
                     return True
@@ -528,13 +812,13 @@ class DeckView:
             messagebox.showwarning("Warning", "Please select a deck to delete.")
             return
         
-        # Get current deck data and stats
-        deck_data = self.app.deck_builder.get_deck_by_id(self.current_deck_id)
-        deck_stats = self.app.deck_builder.get_deck_stats(self.current_deck_id)
+        # Get current deck data and stats in one query
+        overview = self.app.deck_builder.get_deck_overview(self.current_deck_id)
         
-        if not deck_data:
+        if not overview:
             messagebox.showerror("Error", "Could not load deck data.")
             return
+        deck_data, deck_stats = overview
         
         # Define callback function
         def delete_callback() -> bool:
@@ -548,10 +832,8 @@ class DeckView:
                     self.refresh_deck_list()
                     
                     # Clear deck contents
-                    for section in ['main', 'commander', 'sideboard']:
-                        tree = getattr(self, f"{section}_tree")
-                        for item in tree.get_children():
-                            tree.delete(item)
+                    for section in self._trees:
+                        self.set_section_rows(section, [])
                     
                     # Update UI
                     self.deck_info_label.config(text="Select a deck to view details")
@@ -579,28 +861,40 @@ class DeckView:
         
         # Find current deck name for default filename
         current_deck_name = "deck"
-        for deck in self.deck_data:
-            if deck['id'] == self.current_deck_id:
-                current_deck_name = deck['name'].replace(' ', '_')
-                break
+        current_deck = self._deck_by_id.get(self.current_deck_id)
+        if current_deck:
+            current_deck_name = current_deck['name'].replace(' ', '_')
         
         file_path = filedialog.asksaveasfilename(
             title="Export Deck",
             defaultextension=".txt",
-            initialvalue=f"{current_deck_name}.txt",
+            initialfile=f"{current_deck_name}.txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         
         if file_path:
-            try:
-                deck_text = self.app.deck_builder.export_deck_to_text(self.current_deck_id)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(deck_text)
-                
-                messagebox.showinfo("Success", f"Deck exported to {file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export deck: {e}")
+            self.app.start_busy("Exporting deck...")
+            threading.Thread(target=self._do_export, args=(self.current_deck_id, file_path),
+                             daemon=True).start()
+    
+    def _do_export(self, deck_id: int, file_path: str):
+        """Export a deck on a worker thread and report back on the Tk thread."""
+        try:
+            deck_text = self.app.deck_builder.export_deck_to_text(deck_id)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(deck_text)
+            error = None
+        except Exception as e:
+            error = e
+        self.app.post_to_ui(self._export_finished, file_path, error)
+    
+    def _export_finished(self, file_path: str, error: Exception = None):
+        """Show the outcome of a background deck export."""
+        self.app.stop_busy("Ready")
+        if error:
+            messagebox.showerror("Error", f"Failed to export deck: {error}")
+        else:
+            messagebox.showinfo("Success", f"Deck exported to {file_path}")
     
     def add_card_to_deck(self, event=None, section="main"):
         """Add a card to the current deck."""
@@ -622,6 +916,7 @@ class DeckView:
             )
             
             if success:
+                self.invalidate_deck_cards()
                 self.add_card_var.set("")
                 self.refresh_deck_contents()
                 self.app.update_status(f"Added {card_name} to {section}")
@@ -633,7 +928,7 @@ class DeckView:
     
     def edit_card_quantity(self, section):
         """Edit the quantity of a card in the deck."""
-        tree = getattr(self, f"{section}_tree")
+        tree = self._trees[section]
         selection = tree.selection()
         
         if not selection:
@@ -641,7 +936,7 @@ class DeckView:
             return
         
         item = selection[0]
-        deck_card_id = int(tree.item(item)['tags'][0])
+        deck_card_id = int(item)  # Row iids are deck card IDs
         
         # Get full card data
         card_data = self.app.deck_builder.get_deck_card_by_id(deck_card_id)
@@ -657,6 +952,7 @@ class DeckView:
                     # Remove the card
                     success = self.app.deck_builder.remove_card_from_deck(updated_data['id'])
                     if success:
+                        self.invalidate_deck_cards()
                         self.refresh_deck_contents()
                         self.app.update_status(f"Removed '{card_data['name']}' from deck")
                     return success
@@ -669,6 +965,7 @@ class DeckView:
                         updated_data.get('is_sideboard')
                     )
                     if success:
+                        self.invalidate_deck_cards()
                         self.refresh_deck_contents()
                         self.app.update_status(f"Updated '{card_data['name']}' in deck")
                     return success
@@ -688,7 +985,7 @@ class DeckView:
     
     def remove_card_from_deck(self, section):
         """Remove a card from the deck."""
-        tree = getattr(self, f"{section}_tree")
+        tree = self._trees[section]
         selection = tree.selection()
         
         if not selection:
@@ -696,7 +993,7 @@ class DeckView:
         
         item = selection[0]
         card_name = tree.item(item)['text']
-        deck_card_id = int(tree.item(item)['tags'][0])
+        deck_card_id = int(item)  # Row iids are deck card IDs
         
         result = messagebox.askyesno(
             "Confirm Removal",
@@ -707,6 +1004,7 @@ class DeckView:
             try:
                 success = self.app.deck_builder.remove_card_from_deck(deck_card_id)
                 if success:
+                    self.invalidate_deck_cards()
                     self.refresh_deck_contents()
                     self.app.update_status(f"Removed {card_name} from deck")
                 else:
@@ -722,38 +1020,35 @@ class DeckView:
         
         try:
             # Get deck cards and stats
-            deck_cards = self.app.deck_builder.get_deck_cards(self.current_deck_id)
+            deck_cards = self.get_deck_cards()
+            if not any(deck_cards.values()):
+                messagebox.showinfo("Deck Statistics", "This deck is empty.")
+                return
             basic_stats = self.app.deck_builder.get_deck_stats(self.current_deck_id)
             
             # Calculate advanced statistics
-            all_cards = deck_cards['main'] + deck_cards['commander'] + deck_cards['sideboard']
-            
-            # Mana curve
-            mana_curve = {}
-            for card in all_cards:
-                cmc = card.get('cmc', 0)
-                mana_curve[cmc] = mana_curve.get(cmc, 0) + card['quantity']
+            all_cards = chain(deck_cards['main'], deck_cards['commander'], deck_cards['sideboard'])
             
-            # Color distribution
-            color_counts = {'W': 0, 'U': 0, 'B': 0, 'R': 0, 'G': 0, 'Colorless': 0}
+            # Mana curve, color distribution and type distribution in one pass
+            mana_curve = Counter()
+            color_counts = Counter()
+            type_counts = Counter()
             for card in all_cards:
-                colors = card.get('colors', '')
+                quantity = card['quantity']
+                
+                mana_curve[card['_cmc']] += quantity
+                
+                colors = card['_colors']
                 if colors:
-                    for color in colors.split(','):
-                        color = color.strip()
-                        if color in color_counts:
-                            color_counts[color] += card['quantity']
+                    for color in colors:
+                        if color in COLOR_ORDER:
+                            color_counts[color] += quantity
                 else:
-                    color_counts['Colorless'] += card['quantity']
-            
-            # Type distribution
-            type_counts = {}
-            for card in all_cards:
-                type_line = card.get('type_line', '')
-                if type_line:
-                    # Get primary type
-                    primary_type = type_line.split(' ')[0] if type_line else 'Unknown'
-                    type_counts[primary_type] = type_counts.get(primary_type, 0) + card['quantity']
+                    color_counts['Colorless'] += quantity
+                
+                primary_type = card['_primary_type']
+                if primary_type:
+                    type_counts[primary_type] += quantity
             
             # Show statistics dialog
             self.show_statistics_dialog(basic_stats, mana_curve, color_counts, type_counts)
@@ -779,47 +1074,48 @@ class DeckView:
         notebook = ttk.Notebook(stats_dialog)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Basic stats tab
-        basic_frame = ttk.Frame(notebook)
-        notebook.add(basic_frame, text="Basic Stats")
+        # Tab contents are built the first time each tab is shown
+        tab_builders = {}
+        
+        def add_tab(title, build_text, font_size=10):
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=title)
+            tab_builders[str(frame)] = lambda: ttk.Label(
+                frame, text=build_text(), justify=tk.LEFT, font=('TkDefaultFont', font_size)
+            ).pack(padx=20, pady=20)
         
-        basic_text = f"""Total Cards: {basic_stats['total_cards']}
+        def basic_text():
+            return f"""Total Cards: {basic_stats['total_cards']}
 Unique Cards: {basic_stats['unique_cards']}
 Main Deck: {basic_stats['main_deck_count']}
 Average CMC: {basic_stats['avg_cmc']:.2f}"""
         
-        ttk.Label(basic_frame, text=basic_text, justify=tk.LEFT, font=('TkDefaultFont', 11)).pack(padx=20, pady=20)
-        
-        # Mana curve tab
-        curve_frame = ttk.Frame(notebook)
-        notebook.add(curve_frame, text="Mana Curve")
-        
-        curve_text = "Mana Curve:\n\n"
-        for cmc in sorted(mana_curve.keys()):
-            curve_text += f"CMC {cmc}: {mana_curve[cmc]} cards\n"
-        
-        ttk.Label(curve_frame, text=curve_text, justify=tk.LEFT, font=('TkDefaultFont', 10)).pack(padx=20, pady=20)
-        
-        # Color distribution tab
-        color_frame = ttk.Frame(notebook)
-        notebook.add(color_frame, text="Colors")
-        
-        color_text = "Color Distribution:\n\n"
-        for color, count in color_counts.items():
-            if count > 0:
-                color_text += f"{color}: {count} cards\n"
-        
-        ttk.Label(color_frame, text=color_text, justify=tk.LEFT, font=('TkDefaultFont', 10)).pack(padx=20, pady=20)
-        
-        # Type distribution tab
-        type_frame = ttk.Frame(notebook)
-        notebook.add(type_frame, text="Types")
-        
-        type_text = "Type Distribution:\n\n"
-        for card_type, count in sorted(type_counts.items()):
-            type_text += f"{card_type}: {count} cards\n"
-        
-        ttk.Label(type_frame, text=type_text, justify=tk.LEFT, font=('TkDefaultFont', 10)).pack(padx=20, pady=20)
+        def curve_text():
+            curve_lines = ["Mana Curve:", ""]
+            curve_lines.extend(f"CMC {cmc}: {mana_curve[cmc]} cards" for cmc in sorted(mana_curve))
+            return "\n".join(curve_lines)
+        
+        def color_text():
+            color_lines = ["Color Distribution:", ""]
+            color_lines.extend(f"{color}: {color_counts[color]} cards" for color in STAT_COLORS if color_counts[color])
+            return "\n".join(color_lines)
+        
+        def type_text():
+            type_lines = ["Type Distribution:", ""]
+            type_lines.extend(f"{card_type}: {count} cards" for card_type, count in sorted(type_counts.items()))
+            return "\n".join(type_lines)
+        
+        def build_selected_tab(event=None):
+            build = tab_builders.pop(str(notebook.select()), None)
+            if build:
+                build()
+        
+        add_tab("Basic Stats", basic_text, font_size=11)
+        add_tab("Mana Curve", curve_text)
+        add_tab("Colors", color_text)
+        add_tab("Types", type_text)
+        build_selected_tab()
+        notebook.bind('<<NotebookTabChanged>>', build_selected_tab)
         
         # Close button
         ttk.Button(stats_dialog, text="Close", command=stats_dialog.destroy).pack(pady=10)
@@ -829,7 +1125,7 @@ Average CMC: {basic_stats['avg_cmc']:.2f}"""
 
     def view_deck_card_details(self, section):
         """View details for a card in the deck."""
-        tree = getattr(self, f"{section}_tree")
+        tree = self._trees[section]
         selection = tree.selection()
         
         if not selection:
@@ -837,7 +1133,7 @@ Average CMC: {basic_stats['avg_cmc']:.2f}"""
             return
         
         item = selection[0]
-        deck_card_id = int(tree.item(item)['tags'][0])
+        deck_card_id = int(item)  # Row iids are deck card IDs
         
         # Get card data
         card_data = self.app.deck_builder.get_deck_card_by_id(deck_card_id)
@@ -5,7 +5,21 @@ Inventory view for MTG Collection Manager.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+FILTER_DEBOUNCE_MS = 250  # Pause in typing before the name filter refreshes
+
+
+def filter_inventory(inventory: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Apply name/set/foil filters the way InventoryManager.get_inventory does in SQL."""
+    name = filters.get('name', '').lower()
+    set_code = filters.get('set_code')
+    foil = filters.get('foil')
+    return [item for item in inventory
+            if (not name or name in item['name'].lower())
+            and (not set_code or item['set_code'] == set_code)
+            and (foil is None or bool(item['foil']) == foil)]
+
 
 class InventoryView:
     """Inventory management view."""
@@ -15,6 +29,11 @@ class InventoryView:
         self.parent = parent
         self.app = app
         self.frame = ttk.Frame(parent)
+        self._filter_after_id = None  # Pending debounced filter refresh
+        self._inventory_cache: Optional[List[Dict[str, Any]]] = None  # Unfiltered rows
+        self._inventory_collection_id = None
+        self._items_by_id: Dict[int, Dict[str, Any]] = {}  # Snapshot rows by inventory ID
+        self._preload_cancel = None  # Stops the running thumbnail preload when set
         
         self.setup_ui()
         self.refresh()
@@ -37,7 +56,7 @@ class InventoryView:
         self.set_filter_var = tk.StringVar()
         self.set_filter_combo = ttk.Combobox(filter_frame, textvariable=self.set_filter_var, width=15)
         self.set_filter_combo.grid(row=0, column=3, padx=5, pady=5)
-        self.set_filter_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
+        self.set_filter_combo.bind('<<ComboboxSelected>>', self.on_filter_selected)
         
         # Foil filter
         self.foil_filter_var = tk.StringVar(value="All")
@@ -48,7 +67,7 @@ class InventoryView:
                                  values=["All", "Foil Only", "Non-Foil Only"], 
                                  state="readonly", width=12)
         foil_combo.pack(side=tk.LEFT, padx=(5, 0))
-        foil_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
+        foil_combo.bind('<<ComboboxSelected>>', self.on_filter_selected)
         
         # Clear filters button
         ttk.Button(filter_frame, text="Clear Filters", 
@@ -84,13 +103,13 @@ class InventoryView:
         self.tree.column('type', width=150)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         # Pack tree and scrollbars
         self.tree.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
         tree_frame.grid_rowconfigure(0, weight=1)
@@ -136,60 +155,83 @@ class InventoryView:
             self.context_menu.post(event.x_root, event.y_root)
     
     def refresh(self):
-        """Refresh the inventory display."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Reload the inventory from the database and refresh the display."""
+        try:
+            inventory = self.app.inventory_manager.get_inventory(self.app.current_collection_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load inventory: {e}")
+            return
         
-        # Get current filters
-        filters = self.get_current_filters()
+        self.load_inventory(inventory)
+    
+    def load_inventory(self, inventory: List[Dict[str, Any]]):
+        """Cache the collection's unfiltered inventory and display it filtered."""
+        self._inventory_cache = inventory
+        self._inventory_collection_id = self.app.current_collection_id
+        self._items_by_id = {item['id']: item for item in inventory}
+        self.apply_filters()
+        self.frame.after_idle(self.update_set_filter_options, inventory)
+        self.preload_thumbnails(inventory)
+    
+    def preload_thumbnails(self, inventory: List[Dict[str, Any]]):
+        """Preload thumbnails for a snapshot, superseding any preload still running."""
+        if self._preload_cancel is not None:
+            self._preload_cancel.set()
+            self._preload_cancel = None
+        
+        image_urls = [item['image_url'] for item in inventory if item.get('image_url')]
+        if image_urls:
+            self.app.logger.debug(f"Starting preload of {len(image_urls)} images")
+            self._preload_cancel = self.app.image_manager.preload_images(image_urls, 'thumbnail')
+        else:
+            self.app.logger.debug("No image URLs found for preloading")
+    
+    def apply_filters(self):
+        """Display the cached inventory with the current filters applied."""
+        if (self._inventory_cache is None
+                or self._inventory_collection_id != self.app.current_collection_id):
+            self.refresh()
+            return
+        self.populate(filter_inventory(self._inventory_cache, self.get_current_filters()))
+    
+    def get_item_data(self, item_id: int) -> Optional[Dict[str, Any]]:
+        """Get an inventory item's data from the loaded snapshot, querying only on a miss."""
+        item = self._items_by_id.get(item_id)
+        if item is not None:
+            return dict(item)  # Callers may modify their copy
+        return self.app.inventory_manager.get_inventory_item_by_id(item_id)
+    
+    def populate(self, inventory: List[Dict[str, Any]]):
+        """Fill the inventory display from already-fetched inventory rows."""
+        # Clear existing items
+        self.tree.delete(*self.tree.get_children())
         
-        # Get inventory data
         try:
-            inventory = self.app.inventory_manager.get_inventory(
-                self.app.current_collection_id, filters
-            )
-            
-            # Collect image URLs for preloading
-            image_urls = []
-            
-            # Populate tree
-            for item in inventory:
-                foil_text = "Yes" if item['foil'] else "No"
-                
-                self.tree.insert('', tk.END, 
-                    text=item['name'],
-                    values=(
-                        item['quantity'],
-                        foil_text,
-                        item['condition'],
-                        item['set_code'] or '',
-                        item['collector_number'] or '',
-                        item['mana_cost'] or '',
-                        item['type_line'] or ''
-                    ),
-                    tags=(str(item['id']),)
-                )
+            # Populate tree with columns hidden and the scrollbar detached so it
+            # lays out once, not per row
+            self.tree.configure(yscrollcommand='', displaycolumns=())
+            try:
+                for item in inventory:
+                    foil_text = "Yes" if item['foil'] else "No"
                 
-                # DEBUG: Check what image URL we have
-                if item.get('image_url'):
-                    self.app.logger.debug(f"Inventory item '{item['name']}' has image_url: {item['image_url']}")
-                    image_urls.append(item['image_url'])
-                else:
-                    self.app.logger.debug(f"Inventory item '{item['name']}' has NO image_url")
-            
-            # Start preloading images in background
-            if image_urls:
-                self.app.logger.debug(f"Starting preload of {len(image_urls)} images")
-                self.app.image_manager.preload_images(image_urls, 'thumbnail')
-            else:
-                self.app.logger.debug("No image URLs found for preloading")
-            
-            # Update stats
-            self.update_stats(inventory)
+                    self.tree.insert('', tk.END, iid=str(item['id']),
+                        text=item['name'],
+                        values=(
+                            item['quantity'],
+                            foil_text,
+                            item['condition'],
+                            item['set_code'] or '',
+                            item['collector_number'] or '',
+                            item['mana_cost'] or '',
+                            item['type_line'] or ''
+                        )
+                    )
+            finally:
+                self.tree.configure(yscrollcommand=self.v_scrollbar.set, displaycolumns='#all')
+            self.v_scrollbar.set(*self.tree.yview())
             
-            # Update set filter options
-            self.update_set_filter_options(inventory)
+            # Update stats after the rows are drawn
+            self.frame.after_idle(self.update_stats, inventory)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load inventory: {e}")
@@ -213,28 +255,50 @@ class InventoryView:
         return filters
     
     def on_filter_change(self, event=None):
-        """Handle filter changes."""
-        self.refresh()
+        """Handle name filter changes, refreshing once typing pauses."""
+        self._cancel_pending_filter()
+        self._filter_after_id = self.frame.after(FILTER_DEBOUNCE_MS, self._run_debounced_filter)
+    
+    def on_filter_selected(self, event=None):
+        """Handle set/foil filter selection immediately."""
+        self._cancel_pending_filter()
+        self.apply_filters()
+    
+    def _cancel_pending_filter(self):
+        """Cancel a scheduled filter refresh."""
+        if self._filter_after_id is not None:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+    
+    def _run_debounced_filter(self):
+        """Run the refresh scheduled by on_filter_change."""
+        self._filter_after_id = None
+        self.apply_filters()
     
     def clear_filters(self):
         """Clear all filters."""
+        self._cancel_pending_filter()
         self.name_filter_var.set("")
         self.set_filter_var.set("")
         self.foil_filter_var.set("All")
-        self.refresh()
+        self.apply_filters()
     
     def update_stats(self, inventory: List[Dict[str, Any]]):
         """Update collection statistics."""
-        total_cards = sum(item['quantity'] for item in inventory)
+        total_cards = foil_cards = 0
+        for item in inventory:
+            quantity = item['quantity']
+            total_cards += quantity
+            if item['foil']:
+                foil_cards += quantity
         unique_cards = len(inventory)
-        foil_cards = sum(item['quantity'] for item in inventory if item['foil'])
         
         stats_text = f"Total Cards: {total_cards} | Unique Cards: {unique_cards} | Foil Cards: {foil_cards}"
         self.stats_label.config(text=stats_text)
     
     def update_set_filter_options(self, inventory: List[Dict[str, Any]]):
         """Update set filter combo box options."""
-        sets = sorted(set(item['set_code'] for item in inventory if item['set_code']))
+        sets = sorted({item['set_code'] for item in inventory if item['set_code']})
         current_value = self.set_filter_var.get()
         self.set_filter_combo['values'] = [''] + sets
         
@@ -254,10 +318,10 @@ class InventoryView:
             return
         
         item = selection[0]
-        item_id = int(self.tree.item(item)['tags'][0])
+        item_id = int(item)  # Row iids are inventory item IDs
         
         # Get full item data
-        item_data = self.app.inventory_manager.get_inventory_item_by_id(item_id)
+        item_data = self.get_item_data(item_id)
         
         if not item_data:
             messagebox.showerror("Error", "Could not load item data.")
@@ -306,11 +370,12 @@ class InventoryView:
             return
         
         item = selection[0]
-        item_id = int(self.tree.item(item)['tags'][0])
-        card_name = self.tree.item(item)['text']
+        item_id = int(item)  # Row iids are inventory item IDs
+        row = self.tree.item(item)
+        card_name = row['text']
         
         # Get item details for confirmation
-        values = self.tree.item(item)['values']
+        values = row['values']
         quantity = values[0] if len(values) > 0 else "Unknown"
         foil_status = values[1] if len(values) > 1 else "Unknown"
         condition = values[2] if len(values) > 2 else "Unknown"
@@ -358,10 +423,10 @@ class InventoryView:
             return
         
         item = selection[0]
-        item_id = int(self.tree.item(item)['tags'][0])
+        item_id = int(item)  # Row iids are inventory item IDs
         
         # Get full item data
-        item_data = self.app.inventory_manager.get_inventory_item_by_id(item_id)
+        item_data = self.get_item_data(item_id)
         
         if not item_data:
             messagebox.showerror("Error", "Could not load card data.")
@@ -380,6 +445,8 @@ class InventoryView:
                     self.app.quick_new_deck()
                 return
             
+            deck_name_by_id = {deck['id']: deck['name'] for deck in available_decks}
+            
             # Define callback function
             def add_callback(add_data: dict) -> bool:
                 try:
@@ -393,11 +460,7 @@ class InventoryView:
                     
                     if success:
                         # Find deck name for status message
-                        deck_name = "Unknown Deck"
-                        for deck in available_decks:
-                            if deck['id'] == add_data['deck_id']:
-                                deck_name = deck['name']
-                                break
+                        deck_name = deck_name_by_id.get(add_data['deck_id'], "Unknown Deck")
                         
                         section = "commander" if add_data['is_commander'] else ("sideboard" if add_data['is_sideboard'] else "main deck")
                         self.app.update_status(f"Added {add_data['quantity']}x {add_data['card_name']} to {deck_name} ({section})")
@@ -430,10 +493,10 @@ class InventoryView:
             return
         
         item = selection[0]
-        item_id = int(self.tree.item(item)['tags'][0])
+        item_id = int(item)  # Row iids are inventory item IDs
         
         # Get full item data
-        item_data = self.app.inventory_manager.get_inventory_item_by_id(item_id)
+        item_data = self.get_item_data(item_id)
         
         if not item_data:
             messagebox.showerror("Error", "Could not load card data.")
@@ -461,10 +524,10 @@ class InventoryView:
             return
         
         item = selection[0]
-        item_id = int(self.tree.item(item)['tags'][0])
+        item_id = int(item)  # Row iids are inventory item IDs
         
         # Get full item data
-        item_data = self.app.inventory_manager.get_inventory_item_by_id(item_id)
+        item_data = self.get_item_data(item_id)
         
         if not item_data:
             messagebox.showerror("Error", "Could not load card data.")
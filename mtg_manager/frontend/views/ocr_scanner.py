@@ -5,16 +5,56 @@ Ollama Vision Scanner view for MTG Collection Manager.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import sys
 import threading
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 
+# Interval between camera display refreshes (~30 fps)
+CAMERA_RENDER_MS = 33
+
+# Widest the camera or loaded image is shown in the preview
+DISPLAY_MAX_WIDTH = 400
+
+# Capture backends to probe; on Windows CAP_ANY only reopens the DSHOW/MSMF devices
+if sys.platform == 'win32':
+    CAMERA_BACKENDS = [cv2.CAP_DSHOW, cv2.CAP_MSMF]
+else:
+    CAMERA_BACKENDS = [cv2.CAP_ANY]
+CAMERA_INDICES = [0, 1, 2]
+
+# Most card match searches remembered per scanner window
+MATCH_CACHE_SIZE = 128
+
+# Analysis summary lines in display order: the card_data keys a line needs and its formatter
+ANALYSIS_FIELDS = (
+    (('mana_cost',), "Mana Cost: {}\n".format),
+    (('type_line',), "Type: {}\n".format),
+    (('power', 'toughness'), "P/T: {}/{}\n".format),
+    (('oracle_text',), "\nText:\n{}\n".format),
+    (('set_code',), lambda set_code: f"Set: {set_code.upper()}\n"),
+    (('collector_number',), "Collector #: {}\n".format),
+    (('confidence',), "\nConfidence: {}/10".format),
+)
+
+# Ollama options for card analysis: half the cores leaves room for the UI when the
+# model runs on the CPU, and the card JSON fits well within the token limit
+ANALYSIS_OPTIONS = {
+    'num_thread': max(1, (os.cpu_count() or 4) // 2),
+    'num_predict': 512,
+}
+
 class VisionScannerWindow:
     """Vision Scanner window for card recognition using Ollama."""
     
+    # (backend, index) that last opened successfully; tried first next time
+    _last_good_camera: Optional[Tuple[int, int]] = None
+    
     def __init__(self, parent, app):
         """Initialize vision scanner window."""
         self.parent = parent
@@ -23,6 +63,27 @@ class VisionScannerWindow:
         self.camera = None
         self.is_scanning = False
         self.current_frame = None
+        self._latest_frame = None  # Newest camera frame not yet displayed
+        self._frame_lock = threading.Lock()
+        self._capture_thread = None
+        self._capture_stop = None  # Stops the current reader thread when set
+        self._render_after_id = None  # Next scheduled _render_latest
+        # Runs the analysis and match searches; the camera reader keeps its own thread
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scanner')
+        self._analyze_in_flight = False  # Only one vision model request at a time
+        self._analysis_cancel = threading.Event()
+        self._closed = threading.Event()  # Set by close_window; workers stop reporting back
+        
+        # Card match results by (name, set code, collector number), least recently used first
+        self._match_cache: OrderedDict = OrderedDict()
+        self._match_inflight: Dict[tuple, Future] = {}  # Searches running, shared by duplicates
+        self._match_lock = threading.Lock()
+        
+        # Display buffers reused across frames; reallocated if the frame size changes
+        self._display_source_shape = None
+        self._display_bgr = None
+        self._display_rgb = None
+        self._camera_photo = None
         
         # Initialize Ollama client
         try:
@@ -71,6 +132,9 @@ class VisionScannerWindow:
         if selected_model:
             self.model_label.config(text=f"Model: {selected_model}")
             self.status_var.set("Ready - Model selected")
+            
+            # Load the model while the user lines up a card, not on the first capture
+            self._pool.submit(self.ollama_client.load_model)
         else:
             self.model_label.config(text="No model selected")
             self.status_var.set("No model selected - Choose a model to continue")
@@ -177,36 +241,39 @@ class VisionScannerWindow:
     def start_camera(self):
         """Start camera feed with improved error handling."""
         try:
-            # Try different camera backends and indices
-            camera_backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY]
-            camera_indices = [0, 1, 2]  # Try multiple camera indices
+            # Try the camera that worked last time first, then every backend and index
+            candidates = [(backend, index) for backend in CAMERA_BACKENDS for index in CAMERA_INDICES]
+            last_good = VisionScannerWindow._last_good_camera
+            if last_good in candidates:
+                candidates.remove(last_good)
+                candidates.insert(0, last_good)
             
             self.camera = None
             
-            for backend in camera_backends:
-                for index in camera_indices:
-                    try:
-                        self.app.logger.debug(f"Trying camera index {index} with backend {backend}")
-                        test_camera = cv2.VideoCapture(index, backend)
+            for backend, index in candidates:
+                try:
+                    self.app.logger.debug(f"Trying camera index {index} with backend {backend}")
+                    test_camera = cv2.VideoCapture(index, backend)
+                    
+                    if test_camera.isOpened():
+                        # Settings only take effect on some backends before the first read
+                        self._configure_camera(test_camera)
                         
-                        if test_camera.isOpened():
-                            # Test if we can actually read a frame
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                self.camera = test_camera
-                                self.app.logger.info(f"Camera opened successfully: index {index}, backend {backend}")
-                                break
-                            else:
-                                test_camera.release()
+                        # Test if we can actually read a frame
+                        ret, frame = test_camera.read()
+                        if ret and frame is not None:
+                            self.camera = test_camera
+                            VisionScannerWindow._last_good_camera = (backend, index)
+                            self.app.logger.info(f"Camera opened successfully: index {index}, backend {backend}")
+                            break
                         else:
                             test_camera.release()
-                            
-                    except Exception as e:
-                        self.app.logger.debug(f"Camera index {index} with backend {backend} failed: {e}")
-                        continue
-                
-                if self.camera:
-                    break
+                    else:
+                        test_camera.release()
+                        
+                except Exception as e:
+                    self.app.logger.debug(f"Camera index {index} with backend {backend} failed: {e}")
+                    continue
             
             if not self.camera or not self.camera.isOpened():
                 messagebox.showerror("Camera Error", 
@@ -216,52 +283,70 @@ class VisionScannerWindow:
                                      "• Try closing other camera applications")
                 return
             
-            # Configure camera settings
-            try:
-                # Set reasonable resolution
-                self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                self.camera.set(cv2.CAP_PROP_FPS, 30)
-                
-                # Set buffer size to reduce latency
-                self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                
-            except Exception as e:
-                self.app.logger.warning(f"Could not set camera properties: {e}")
-            
-            # Test frame capture
-            ret, test_frame = self.camera.read()
-            if not ret or test_frame is None:
-                self.camera.release()
-                messagebox.showerror("Camera Error", "Camera opened but cannot capture frames")
-                return
+            fourcc = int(self.camera.get(cv2.CAP_PROP_FOURCC))
+            fourcc_text = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+            self.app.logger.info(f"Camera stream format: {fourcc_text!r}")
             
             self.is_scanning = True
             self.start_camera_btn.config(state=tk.DISABLED)
             self.stop_camera_btn.config(state=tk.NORMAL)
-            self.capture_btn.config(state=tk.NORMAL)
+            if not self._analyze_in_flight:
+                self.capture_btn.config(state=tk.NORMAL)
             self.status_var.set("Camera started")
             
-            # Start the camera feed update loop
-            self.update_camera_feed()
+            # Read frames on a background thread; the Tk loop only displays the newest.
+            # Each reader gets its own stop flag, so one outliving a stop never
+            # keeps running alongside the reader of a restarted camera
+            self._capture_stop = threading.Event()
+            self._capture_thread = threading.Thread(
+                target=self._capture_loop, args=(self.camera, self._capture_stop), daemon=True
+            )
+            self._capture_thread.start()
+            self._render_latest()
             
         except Exception as e:
             self.app.logger.error(f"Failed to start camera: {e}")
             messagebox.showerror("Error", f"Failed to start camera: {e}")
     
+    def _configure_camera(self, camera):
+        """Apply the capture settings to a newly opened camera."""
+        try:
+            # Compressed MJPG needs far less USB bandwidth than raw YUY2
+            camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            
+            # Set reasonable resolution
+            camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            camera.set(cv2.CAP_PROP_FPS, 30)
+            
+            # Set buffer size to reduce latency
+            camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+        except Exception as e:
+            self.app.logger.warning(f"Could not set camera properties: {e}")
+    
     def stop_camera(self):
         """Stop camera feed."""
         self.is_scanning = False
-        if self.camera:
-            try:
-                self.camera.release()
-            except Exception as e:
-                self.app.logger.error(f"Error releasing camera: {e}")
-            finally:
-                self.camera = None
+        if self._render_after_id is not None:
+            self.window.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        
+        if self._capture_thread is not None:
+            # The reader releases the camera itself once its current read returns
+            self._capture_stop.set()
+            self._capture_thread.join(timeout=1.0)
+            if self._capture_thread.is_alive():
+                self.app.logger.warning("Camera reader still busy; it will release the camera when done")
+            self._capture_thread = self._capture_stop = None
+        elif self.camera:
+            self._release_camera(self.camera)
+        self.camera = None
         
-        # Release any OpenCV resources
-        cv2.destroyAllWindows()
+        with self._frame_lock:
+            self._latest_frame = None
+        self._display_source_shape = None
+        self._display_bgr = self._display_rgb = self._camera_photo = None
         
         self.start_camera_btn.config(state=tk.NORMAL)
         self.stop_camera_btn.config(state=tk.DISABLED)
@@ -269,38 +354,64 @@ class VisionScannerWindow:
         self.camera_label.config(image="", text="Camera stopped")
         self.status_var.set("Camera stopped")
     
-    def update_camera_feed(self):
-        """Update camera feed display with error handling."""
+    def _capture_loop(self, camera, stop: threading.Event):
+        """Read camera frames into the single-slot frame buffer until stop is set, then release the camera."""
+        try:
+            while not stop.is_set():
+                try:
+                    ret, frame = camera.read()
+                except Exception as e:
+                    self.app.logger.error(f"Error reading camera frame: {e}")
+                    ret, frame = False, None
+                
+                if stop.is_set():
+                    break
+                if ret and frame is not None:
+                    with self._frame_lock:
+                        self._latest_frame = frame
+                else:
+                    # Handle frame read failure
+                    self.app.logger.warning("Failed to read camera frame")
+                    stop.wait(CAMERA_RENDER_MS / 1000)
+        finally:
+            # Only this thread reads the camera, so only it can release it safely
+            self._release_camera(camera)
+    
+    def _release_camera(self, camera):
+        """Release a camera, logging any error."""
+        try:
+            camera.release()
+        except Exception as e:
+            self.app.logger.error(f"Error releasing camera: {e}")
+    
+    def _render_latest(self):
+        """Display the newest captured camera frame with error handling."""
+        self._render_after_id = None
         if not self.is_scanning or not self.camera:
             return
         
+        with self._frame_lock:
+            frame, self._latest_frame = self._latest_frame, None
+        
         try:
-            ret, frame = self.camera.read()
-            if ret and frame is not None:
-                self.current_frame = frame.copy()
-                
-                # Convert to RGB for display
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if frame is not None:
+                self.current_frame = frame  # Each read returns a new array
                 
-                # Resize for display
-                height, width = frame_rgb.shape[:2]
-                max_width = 400
-                if width > max_width:
-                    scale = max_width / width
-                    new_width = int(width * scale)
-                    new_height = int(height * scale)
-                    frame_rgb = cv2.resize(frame_rgb, (new_width, new_height))
+                if frame.shape != self._display_source_shape:
+                    self._allocate_display_buffers(frame.shape)
                 
-                # Convert to PhotoImage
-                image = Image.fromarray(frame_rgb)
-                photo = ImageTk.PhotoImage(image)
+                # Resize, then convert the smaller image to RGB, into the reused buffers
+                source = frame
+                if self._display_bgr is not None:
+                    source = cv2.resize(frame, self._display_bgr.shape[1::-1], dst=self._display_bgr,
+                                        interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self._display_rgb)
                 
-                self.camera_label.config(image=photo, text="")
-                self.camera_label.image = photo
-                
-            else:
-                # Handle frame read failure
-                self.app.logger.warning("Failed to read camera frame")
+                # Update the existing PhotoImage's pixels in place
+                self._camera_photo.paste(Image.fromarray(self._display_rgb))
+                if getattr(self.camera_label, 'image', None) is not self._camera_photo:
+                    self.camera_label.config(image=self._camera_photo, text="")
+                    self.camera_label.image = self._camera_photo
                 
         except Exception as e:
             self.app.logger.error(f"Error updating camera feed: {e}")
@@ -308,7 +419,20 @@ class VisionScannerWindow:
             
         # Schedule next update
         if self.is_scanning:
-            self.window.after(50, self.update_camera_feed)  # Slightly slower update rate
+            self._render_after_id = self.window.after(CAMERA_RENDER_MS, self._render_latest)
+    
+    def _allocate_display_buffers(self, frame_shape):
+        """Allocate the preview buffers and PhotoImage for frames of the given shape."""
+        height, width = frame_shape[:2]
+        if width > DISPLAY_MAX_WIDTH:
+            scale = DISPLAY_MAX_WIDTH / width
+            width, height = int(width * scale), int(height * scale)
+            self._display_bgr = np.empty((height, width, 3), dtype=np.uint8)
+        else:
+            self._display_bgr = None
+        self._display_rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self._camera_photo = ImageTk.PhotoImage('RGB', (width, height))
+        self._display_source_shape = frame_shape
     
     def capture_and_analyze(self):
         """Capture current frame and analyze with Ollama."""
@@ -320,20 +444,40 @@ class VisionScannerWindow:
             messagebox.showerror("Error", "No AI model selected")
             return
         
+        if self._analyze_in_flight:
+            self.status_var.set("Analysis already running")
+            return
+        
         self.status_var.set("Analyzing with AI...")
+        self._start_analysis(self.current_frame)
+    
+    def _start_analysis(self, image: np.ndarray):
+        """Analyze an image with Ollama in the background, disabling new requests until it finishes."""
+        self._analyze_in_flight = True
+        self.capture_btn.config(state=tk.DISABLED)
+        self.load_file_btn.config(state=tk.DISABLED)
+        cancelled = self._analysis_cancel = threading.Event()
         
         def analyze_thread():
             try:
                 # Analyze card with Ollama
-                card_data = self.ollama_client.analyze_card_image(self.current_frame)
+                card_data = self.ollama_client.analyze_card_image(image, options=ANALYSIS_OPTIONS)
                 
-                # Update UI in main thread
-                self.window.after(0, lambda: self.process_analysis_result(card_data))
+                # Update UI in main thread unless the window was closed meanwhile
+                if not cancelled.is_set():
+                    self.app.post_to_ui(self.process_analysis_result, card_data)
                 
             except Exception as e:
-                self.window.after(0, lambda: self.handle_analysis_error(e))
+                if not cancelled.is_set():
+                    self.app.post_to_ui(self.handle_analysis_error, e)
         
-        threading.Thread(target=analyze_thread, daemon=True).start()
+        self._pool.submit(analyze_thread)
+    
+    def _finish_analysis(self):
+        """Allow a new analysis once the pending one has reported back."""
+        self._analyze_in_flight = False
+        self.capture_btn.config(state=tk.NORMAL if self.is_scanning else tk.DISABLED)
+        self.load_file_btn.config(state=tk.NORMAL)
     
     def load_image_file(self):
         """Load and scan an image file."""
@@ -341,6 +485,10 @@ class VisionScannerWindow:
             messagebox.showerror("Error", "No AI model selected")
             return
         
+        if self._analyze_in_flight:
+            self.status_var.set("Analysis already running")
+            return
+        
         file_path = filedialog.askopenfilename(
             title="Select Image File",
             filetypes=[
@@ -361,36 +509,29 @@ class VisionScannerWindow:
             
             self.current_frame = image
             
-            # Display image
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            height, width = image_rgb.shape[:2]
-            max_width = 400
-            if width > max_width:
-                scale = max_width / width
+            # Display image, shrinking it before the color conversion
+            display_image = image
+            height, width = image.shape[:2]
+            if width > DISPLAY_MAX_WIDTH:
+                scale = DISPLAY_MAX_WIDTH / width
                 new_width = int(width * scale)
                 new_height = int(height * scale)
-                image_rgb = cv2.resize(image_rgb, (new_width, new_height))
+                display_image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+            image_rgb = display_image[..., ::-1]  # BGR -> RGB view; PIL copies it once
             
             photo = ImageTk.PhotoImage(Image.fromarray(image_rgb))
             self.camera_label.config(image=photo, text="")
             self.camera_label.image = photo
             
             self.status_var.set("Analyzing image...")
-            
-            def analyze_thread():
-                try:
-                    card_data = self.ollama_client.analyze_card_image(image)
-                    self.window.after(0, lambda: self.process_analysis_result(card_data))
-                except Exception as e:
-                    self.window.after(0, lambda: self.handle_analysis_error(e))
-            
-            threading.Thread(target=analyze_thread, daemon=True).start()
+            self._start_analysis(image)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {e}")
     
     def process_analysis_result(self, card_data: Optional[dict]):
         """Process AI analysis result."""
+        self._finish_analysis()
         if not card_data:
             self.status_var.set("Analysis failed")
             self.analysis_text.delete('1.0', tk.END)
@@ -403,30 +544,12 @@ class VisionScannerWindow:
         self.analysis_text.delete('1.0', tk.END)
         
         if 'name' in card_data:
-            analysis_text = f"Card Name: {card_data['name']}\n\n"
-            
-            if 'mana_cost' in card_data:
-                analysis_text += f"Mana Cost: {card_data['mana_cost']}\n"
-            
-            if 'type_line' in card_data:
-                analysis_text += f"Type: {card_data['type_line']}\n"
-            
-            if 'power' in card_data and 'toughness' in card_data:
-                analysis_text += f"P/T: {card_data['power']}/{card_data['toughness']}\n"
-            
-            if 'oracle_text' in card_data:
-                analysis_text += f"\nText:\n{card_data['oracle_text']}\n"
+            parts = [f"Card Name: {card_data['name']}\n\n"]
+            for keys, format_line in ANALYSIS_FIELDS:
+                if all(key in card_data for key in keys):
+                    parts.append(format_line(*(card_data[key] for key in keys)))
             
-            if 'set_code' in card_data:
-                analysis_text += f"Set: {card_data['set_code'].upper()}\n"
-
-            if 'collector_number' in card_data:
-                analysis_text += f"Collector #: {card_data['collector_number']}\n"
-
-            if 'confidence' in card_data:
-                analysis_text += f"\nConfidence: {card_data['confidence']}/10"
-            
-            self.analysis_text.insert('1.0', analysis_text)
+            self.analysis_text.insert('1.0', "".join(parts))
             self.status_var.set(f"Analyzed: {card_data['name']}")
             
             # Search for matching cards
@@ -441,41 +564,101 @@ class VisionScannerWindow:
     
     def search_matching_cards(self, card_data: dict):
         """Search for cards matching the detected name and other attributes."""
-        def search_thread():
-            try:
-                card_name = card_data.get('name', '')
-                set_code = card_data.get('set_code', '')
-                collector_number = card_data.get('collector_number', '')
-
-                query_parts = []
-                if card_name:
-                    query_parts.append(f'name:"{card_name}"')
-                if set_code:
-                    query_parts.append(f'set:"{set_code}"')
-                if collector_number:
-                    query_parts.append(f'cn:"{collector_number}"')
-                
-                search_query = " ".join(query_parts) if query_parts else card_name
-
-                results = []
-                if search_query:
-                    # Try exact match first
-                    exact_match_query = f'!"{card_name}"' if card_name else search_query
-                    exact_results = self.app.scryfall_client.search_cards_in_cache(exact_match_query, limit=1)
-                    if exact_results:
-                        results = exact_results
-                    else:
-                        # Fallback to broader search if exact match isn't found
-                        api_result = self.app.scryfall_client.search_cards(search_query)
-                        if api_result and 'data' in api_result:
-                            results = api_result['data'][:10] # Limit to top 10 results
-                
-                self.window.after(0, lambda: self.display_card_matches(results))
-                
-            except Exception as e:
-                self.window.after(0, lambda: messagebox.showerror("Error", f"Search failed: {e}"))
+        card_name = card_data.get('name', '')
+        set_code = card_data.get('set_code', '')
+        collector_number = card_data.get('collector_number', '')
+        key = tuple(str(value or '').lower() for value in (card_name, set_code, collector_number))
+        
+        # Reuse remembered matches, or attach to an identical search already running
+        with self._match_lock:
+            results = self._match_cache.get(key)
+            if results is not None:
+                self._match_cache.move_to_end(key)
+            else:
+                future = self._match_inflight.get(key)
+                start_search = future is None
+                if start_search:
+                    future = self._match_inflight[key] = Future()
+        
+        if results is not None:
+            self.display_card_matches(results)
+            return
         
-        threading.Thread(target=search_thread, daemon=True).start()
+        future.add_done_callback(self._report_matches)
+        if start_search:
+            self._pool.submit(self._run_match_search, key, future,
+                              card_name, set_code, collector_number)
+    
+    def _run_match_search(self, key: tuple, future: Future,
+                          card_name: str, set_code: str, collector_number: str):
+        """Run a match search on the pool and resolve the future its requests share."""
+        try:
+            results = self._find_card_matches(card_name, set_code, collector_number)
+            if results:
+                self._store_matches(key, results)
+        except Exception as e:
+            self._finish_match_search(key)
+            future.set_exception(e)
+            return
+        self._finish_match_search(key)
+        future.set_result(results)
+    
+    def _report_matches(self, future: Future):
+        """Show a finished search's matches, or its error, unless the window has closed."""
+        error = future.exception()
+        if error is None:
+            self._post_if_open(self.display_card_matches, future.result())
+        else:
+            self._post_if_open(messagebox.showerror, "Error", f"Search failed: {error}")
+    
+    def _post_if_open(self, func, *args):
+        """Queue func(*args) for the UI thread, skipping it if the window closes first."""
+        if not self._closed.is_set():
+            self.app.post_to_ui(self._run_if_open, func, *args)
+    
+    def _run_if_open(self, func, *args):
+        """Run a queued UI update if the window is still open."""
+        if not self._closed.is_set():
+            func(*args)
+    
+    def _store_matches(self, key: tuple, results: List[dict]):
+        """Remember a search's matches, dropping the least recently used beyond the cap."""
+        with self._match_lock:
+            self._match_cache[key] = results
+            self._match_cache.move_to_end(key)
+            while len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+    
+    def _finish_match_search(self, key: tuple):
+        """Stop sharing a finished search with new requests."""
+        with self._match_lock:
+            self._match_inflight.pop(key, None)
+    
+    def _find_card_matches(self, card_name: str, set_code: str, collector_number: str) -> List[dict]:
+        """Look up cards matching the detected attributes, in the cache first, then on Scryfall."""
+        query_parts = []
+        if card_name:
+            query_parts.append(f'name:"{card_name}"')
+        if set_code:
+            query_parts.append(f'set:"{set_code}"')
+        if collector_number:
+            query_parts.append(f'cn:"{collector_number}"')
+        
+        search_query = " ".join(query_parts) if query_parts else card_name
+
+        results = []
+        if search_query:
+            # Exact and partial name matches from the local cache, best first
+            results = self.app.scryfall_client.search_cards_prioritized(
+                card_name, set_code, collector_number, limit=10
+            )
+            if not results:
+                # Fallback to a Scryfall search if the cache has nothing
+                api_result = self.app.scryfall_client.search_cards(search_query)
+                if api_result and 'data' in api_result:
+                    results = api_result['data'][:10] # Limit to top 10 results
+        
+        return results
     
     def display_card_matches(self, cards: List[dict]):
         """Display matching cards in the listbox."""
@@ -487,11 +670,13 @@ class VisionScannerWindow:
             self.add_to_inventory_btn.config(state=tk.DISABLED)
             return
         
+        rows = []
         for card in cards:
             display_text = f"{card['name']} ({card.get('set', '').upper()})"
             if card.get('collector_number'):
                 display_text += f" #{card['collector_number']}"
-            self.matches_listbox.insert(tk.END, display_text)
+            rows.append(display_text)
+        self.matches_listbox.insert(tk.END, *rows)
         
         self.add_to_inventory_btn.config(state=tk.NORMAL)
     
@@ -579,6 +764,7 @@ class VisionScannerWindow:
     
     def handle_analysis_error(self, error: Exception):
         """Handle AI analysis error."""
+        self._finish_analysis()
         self.status_var.set("Analysis failed")
         messagebox.showerror("Analysis Error", f"AI analysis failed: {error}")
         self.app.logger.error(f"AI analysis error: {error}")
@@ -592,5 +778,8 @@ class VisionScannerWindow:
     
     def close_window(self):
         """Close the scanner window."""
+        self._closed.set()  # Drop the results of match searches still running
+        self._analysis_cancel.set()  # Drop the result of any analysis still running
+        self._pool.shutdown(wait=False)
         self.stop_camera()
         self.window.destroy()
\ No newline at end of file
@@ -5,9 +5,14 @@ Trade view for MTG Collection Manager.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+from frontend.dialogs.trade_dialog import TradeDialog
+
+FILTER_DEBOUNCE_MS = 250  # Pause after a date filter change before the trades refresh
+TRANSACTIONS_PAGE_SIZE = 200  # Transaction rows added to the tree per scroll-to-end
+
 class TradeView:
     """Trade management view."""
     
@@ -16,6 +21,10 @@ class TradeView:
         self.parent = parent
         self.app = app
         self.frame = ttk.Frame(parent)
+        self._filter_after_id = None  # Pending debounced filter refresh
+        self._transactions: List[Dict[str, Any]] = []  # Transactions shown, a page at a time
+        self._rows_shown = 0
+        self._append_after_id = None  # Pending next-page append
         
         self.setup_ui()
         self.refresh()
@@ -74,13 +83,13 @@ class TradeView:
         self.transactions_tree.column('note', width=200)
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(transactions_frame, orient=tk.VERTICAL, command=self.transactions_tree.yview)
+        self.v_scrollbar = ttk.Scrollbar(transactions_frame, orient=tk.VERTICAL, command=self.transactions_tree.yview)
         h_scrollbar = ttk.Scrollbar(transactions_frame, orient=tk.HORIZONTAL, command=self.transactions_tree.xview)
-        self.transactions_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.transactions_tree.configure(yscrollcommand=self._on_transactions_scroll, xscrollcommand=h_scrollbar.set)
         
         # Pack tree and scrollbars
         self.transactions_tree.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
         transactions_frame.grid_rowconfigure(0, weight=1)
@@ -106,73 +115,119 @@ class TradeView:
     
     def refresh(self):
         """Refresh the trade view."""
-        # Clear existing items
-        for item in self.transactions_tree.get_children():
-            self.transactions_tree.delete(item)
-        
         try:
             # Get trade transactions
-            transactions = self.app.trade_tracker.get_trade_transactions(self.app.current_collection_id)
-            
-            # Apply date filter
-            filtered_transactions = self.apply_date_filter(transactions)
-            
-            # Populate tree
-            for transaction in filtered_transactions:
-                self.transactions_tree.insert('', tk.END,
-                    text=transaction['id'],
-                    values=(
-                        transaction['partner'] or 'Unknown',
-                        transaction['date'][:10] if transaction['date'] else '',
-                        transaction['cards_out'] or 0,
-                        transaction['cards_in'] or 0,
-                        transaction['note'] or ''
-                    ),
-                    tags=(str(transaction['id']),)
-                )
+            transactions = self.app.trade_tracker.get_trade_transactions(
+                self.app.current_collection_id, self.date_filter_cutoff()
+            )
+        except Exception as e:
+            self.set_transaction_rows([])
+            messagebox.showerror("Error", f"Failed to load trades: {e}")
+            return
+        
+        self.populate(transactions)
+    
+    def populate(self, transactions: List[Dict[str, Any]], stats: Dict[str, Any] = None):
+        """Fill the trade view from already-fetched, date-filtered transactions (and statistics, if given)."""
+        try:
+            self.set_transaction_rows(transactions)
             
             # Update statistics
-            self.update_statistics()
+            self.update_statistics(stats)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load trades: {e}")
     
-    def apply_date_filter(self, transactions):
-        """Apply date filter to transactions."""
-        filter_value = self.date_filter_var.get()
+    def set_transaction_rows(self, transactions: List[Dict[str, Any]]):
+        """Replace the transaction rows, adding only the first page of them."""
+        if self._append_after_id is not None:
+            self.transactions_tree.after_cancel(self._append_after_id)
+            self._append_after_id = None
+        self.transactions_tree.delete(*self.transactions_tree.get_children())
+        self._transactions = transactions
+        self._rows_shown = 0
+        self.append_transaction_rows()
+    
+    def append_transaction_rows(self):
+        """Add the next page of transaction rows, laying out and updating the scrollbar once at the end."""
+        self._append_after_id = None
+        start = self._rows_shown
+        page = self._transactions[start:start + TRANSACTIONS_PAGE_SIZE]
+        if not page:
+            return
         
-        if filter_value == "all":
-            return transactions
+        tree = self.transactions_tree
+        tree.configure(yscrollcommand='', displaycolumns=())
+        try:
+            for transaction in page:
+                tree.insert('', tk.END, iid=str(transaction['id']),
+                    text=transaction['id'],
+                    values=(
+                        transaction['partner'],
+                        transaction['date'],
+                        transaction['cards_out'],
+                        transaction['cards_in'],
+                        transaction['note']
+                    )
+                )
+        finally:
+            tree.configure(yscrollcommand=self._on_transactions_scroll, displaycolumns='#all')
+        self._rows_shown = start + len(page)
+        self._on_transactions_scroll(*tree.yview())
+    
+    def remove_transaction_row(self, item: str, transaction_id: int):
+        """Remove a deleted transaction's row without rebuilding the tree."""
+        self.transactions_tree.delete(item)
+        for i, transaction in enumerate(self._transactions):
+            if transaction['id'] == transaction_id:
+                del self._transactions[i]
+                if i < self._rows_shown:
+                    self._rows_shown -= 1
+                break
+        self._on_transactions_scroll(*self.transactions_tree.yview())
+    
+    def _on_transactions_scroll(self, first, last):
+        """Update the scrollbar, and add more rows once the end of the transactions is in view."""
+        self.v_scrollbar.set(first, last)
+        if (float(last) >= 1.0 and self._rows_shown < len(self._transactions)
+                and self._append_after_id is None):
+            self._append_after_id = self.transactions_tree.after_idle(self.append_transaction_rows)
+    
+    def date_filter_cutoff(self) -> Optional[datetime]:
+        """Get the earliest trade date the date filter shows, or None for all trades."""
+        filter_value = self.date_filter_var.get()
         
         # Calculate cutoff date
         now = datetime.now()
         if filter_value == "last_week":
-            cutoff = now - timedelta(weeks=1)
+            return now - timedelta(weeks=1)
         elif filter_value == "last_month":
-            cutoff = now - timedelta(days=30)
+            return now - timedelta(days=30)
         elif filter_value == "last_year":
-            cutoff = now - timedelta(days=365)
-        else:
-            return transactions
-        
-        # Filter transactions
-        filtered = []
-        for transaction in transactions:
-            if transaction['date']:
-                trade_date = datetime.fromisoformat(transaction['date'].replace('Z', '+00:00'))
-                if trade_date >= cutoff:
-                    filtered.append(transaction)
-        
-        return filtered
+            return now - timedelta(days=365)
+        return None
     
     def on_filter_change(self, event=None):
-        """Handle filter change."""
+        """Handle filter change, refreshing once the selection settles."""
+        self._cancel_pending_filter()
+        self._filter_after_id = self.frame.after(FILTER_DEBOUNCE_MS, self._run_debounced_filter)
+    
+    def _cancel_pending_filter(self):
+        """Cancel a scheduled filter refresh."""
+        if self._filter_after_id is not None:
+            self.frame.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+    
+    def _run_debounced_filter(self):
+        """Run the refresh scheduled by on_filter_change."""
+        self._filter_after_id = None
         self.refresh()
     
-    def update_statistics(self):
+    def update_statistics(self, stats: Dict[str, Any] = None):
         """Update trade statistics."""
         try:
-            stats = self.app.trade_tracker.get_trade_stats(self.app.current_collection_id)
+            if stats is None:
+                stats = self.app.trade_tracker.get_trade_stats(self.app.current_collection_id)
             
             stats_text = (f"Total Transactions: {stats['total_transactions']} | "
                          f"Cards Given: {stats['total_cards_given']} | "
@@ -187,16 +242,15 @@ class TradeView:
     
     def new_trade(self):
         """Open new trade dialog."""
-        from frontend.dialogs.trade_dialog import TradeDialog
-        
         dialog = TradeDialog(self.app.root, self.app)
         result = dialog.show()
         
         if result == 'recorded':
-            self.refresh()
             # Also refresh inventory view if visible
+            views = [self]
             if hasattr(self.app, 'inventory_view'):
-                self.app.inventory_view.refresh()
+                views.append(self.app.inventory_view)
+            self.app.request_refresh(*views)
     
     def view_trade_details(self, event=None):
         """View details of selected trade."""
@@ -205,8 +259,7 @@ class TradeView:
             messagebox.showwarning("Warning", "Please select a trade to view.")
             return
         
-        item = selection[0]
-        transaction_id = int(self.transactions_tree.item(item)['tags'][0])
+        transaction_id = int(selection[0])
         
         # Get detailed trade information
         self.show_trade_details_dialog(transaction_id)
@@ -214,42 +267,74 @@ class TradeView:
     def show_trade_details_dialog(self, transaction_id):
         """Show detailed trade information."""
         # Get trade details
-        trades = self.app.trade_tracker.get_trades(self.app.current_collection_id)
-        transaction_trades = [t for t in trades if t.get('transaction_id') == transaction_id]
+        transaction_trades = self.app.trade_tracker.get_trades_for_transaction(transaction_id)
         
         if not transaction_trades:
             messagebox.showerror("Error", "Trade details not found.")
             return
         
-        # Create details dialog
+        # The dialog is built once and hidden on close; reopening only refills it
+        dialog = getattr(self, '_details_dialog', None)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_details_dialog()
+        
+        dialog.title(f"Trade Details - Transaction {transaction_id}")
+        
+        # Trade info
+        first_trade = transaction_trades[0]
+        self._details_partner_label.config(text=f"Partner: {first_trade['partner']}")
+        self._details_date_label.config(text=f"Date: {first_trade['date'][:10]}")
+        self._details_note_label.config(text=f"Note: {first_trade['note']}")
+        self._details_notebook.select(0)
+        
+        # Populate trees, each with columns hidden so it lays out once, not per row
+        out_rows = [(t['card_name'], abs(t['quantity']), t['set_code'] or '')
+                    for t in transaction_trades if t['quantity'] < 0]
+        in_rows = [(t['card_name'], t['quantity'], t['set_code'] or '')
+                   for t in transaction_trades if t['quantity'] >= 0]
+        for tree, rows in ((self._details_out_tree, out_rows), (self._details_in_tree, in_rows)):
+            tree.delete(*tree.get_children())
+            tree.configure(displaycolumns=())
+            try:
+                for name, quantity, set_code in rows:
+                    tree.insert('', tk.END, text=name, values=(quantity, set_code))
+            finally:
+                tree.configure(displaycolumns='#all')
+        
+        dialog.deiconify()
+        dialog.grab_set()
+    
+    def _build_details_dialog(self) -> tk.Toplevel:
+        """Build the (initially hidden) trade details dialog."""
         details_dialog = tk.Toplevel(self.app.root)
-        details_dialog.title(f"Trade Details - Transaction {transaction_id}")
+        details_dialog.withdraw()
         details_dialog.geometry("500x400")
         details_dialog.transient(self.app.root)
-        details_dialog.grab_set()
         
         # Trade info
-        first_trade = transaction_trades[0]
         info_frame = ttk.LabelFrame(details_dialog, text="Trade Information")
         info_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Label(info_frame, text=f"Partner: {first_trade['partner']}").pack(anchor=tk.W, padx=10, pady=2)
-        ttk.Label(info_frame, text=f"Date: {first_trade['date'][:10]}").pack(anchor=tk.W, padx=10, pady=2)
-        ttk.Label(info_frame, text=f"Note: {first_trade['note']}").pack(anchor=tk.W, padx=10, pady=2)
+        self._details_partner_label = ttk.Label(info_frame, text="")
+        self._details_partner_label.pack(anchor=tk.W, padx=10, pady=2)
+        self._details_date_label = ttk.Label(info_frame, text="")
+        self._details_date_label.pack(anchor=tk.W, padx=10, pady=2)
+        self._details_note_label = ttk.Label(info_frame, text="")
+        self._details_note_label.pack(anchor=tk.W, padx=10, pady=2)
         
         # Cards traded
         cards_frame = ttk.LabelFrame(details_dialog, text="Cards Traded")
         cards_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create notebook for incoming/outgoing
-        notebook = ttk.Notebook(cards_frame)
+        self._details_notebook = notebook = ttk.Notebook(cards_frame)
         notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Outgoing cards
         out_frame = ttk.Frame(notebook)
         notebook.add(out_frame, text="Given Away")
         
-        out_tree = ttk.Treeview(out_frame, columns=('quantity', 'set'), show='tree headings')
+        self._details_out_tree = out_tree = ttk.Treeview(out_frame, columns=('quantity', 'set'), show='tree headings')
         out_tree.heading('#0', text='Card Name')
         out_tree.heading('quantity', text='Qty')
         out_tree.heading('set', text='Set')
@@ -259,27 +344,23 @@ class TradeView:
         in_frame = ttk.Frame(notebook)
         notebook.add(in_frame, text="Received")
         
-        in_tree = ttk.Treeview(in_frame, columns=('quantity', 'set'), show='tree headings')
+        self._details_in_tree = in_tree = ttk.Treeview(in_frame, columns=('quantity', 'set'), show='tree headings')
         in_tree.heading('#0', text='Card Name')
         in_tree.heading('quantity', text='Qty')
         in_tree.heading('set', text='Set')
         in_tree.pack(fill=tk.BOTH, expand=True)
         
-        # Populate trees
-        for trade in transaction_trades:
-            if trade['quantity'] < 0:  # Outgoing
-                out_tree.insert('', tk.END,
-                    text=trade['card_name'],
-                    values=(abs(trade['quantity']), trade['set_code'] or '')
-                )
-            else:  # Incoming
-                in_tree.insert('', tk.END,
-                    text=trade['card_name'],
-                    values=(trade['quantity'], trade['set_code'] or '')
-                )
+        def close():
+            details_dialog.grab_release()
+            details_dialog.withdraw()
         
         # Close button
-        ttk.Button(details_dialog, text="Close", command=details_dialog.destroy).pack(pady=10)
+        ttk.Button(details_dialog, text="Close", command=close).pack(pady=10)
+        details_dialog.bind('<Escape>', lambda e: close())
+        details_dialog.protocol("WM_DELETE_WINDOW", close)
+        
+        self._details_dialog = details_dialog
+        return details_dialog
     
     def delete_trade(self):
         """Delete selected trade."""
@@ -289,8 +370,8 @@ class TradeView:
             return
         
         item = selection[0]
-        transaction_id = int(self.transactions_tree.item(item)['tags'][0])
-        partner = self.transactions_tree.item(item)['values'][0]
+        transaction_id = int(item)
+        partner = self.transactions_tree.item(item, 'values')[0]
         
         result = messagebox.askyesno(
             "Confirm Deletion",
@@ -304,7 +385,8 @@ class TradeView:
             try:
                 success = self.app.trade_tracker.delete_trade_transaction(transaction_id)
                 if success:
-                    self.refresh()
+                    self.remove_transaction_row(item, transaction_id)
+                    self.update_statistics()
                     self.app.update_status(f"Deleted trade with {partner}")
                 else:
                     messagebox.showerror("Error", "Failed to delete trade")
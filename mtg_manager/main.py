@@ -8,7 +8,11 @@ import tkinter as tk
 from tkinter import messagebox
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -16,16 +20,31 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from backend.utils.db import DatabaseManager
 from frontend.gui import MTGCollectionApp
 
+# Writes queued log records to the log file and console off the calling thread
+_log_listener = None
+
 def setup_logging():
     """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('mtg_manager.log'),
-            logging.StreamHandler()
-        ]
-    )
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler('mtg_manager.log'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Log calls only enqueue the record; the listener thread does the I/O
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 def create_directories():
     """Create necessary directories if they don't exist."""
@@ -36,8 +55,10 @@ def create_directories():
         'database'
     ]
     
+    # Only directories that are missing need a makedirs call
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
 def main():
     """Main application entry point."""
@@ -53,11 +74,11 @@ def main():
         db_manager = DatabaseManager()
         db_manager.initialize_database()
         
-        # Pre-load ScryfallClient singleton to avoid multiple cache loads
-        logger.info("Initializing card database cache...")
+        # Pre-load the ScryfallClient singleton while the window is built;
+        # the first use of the client waits for it
+        logger.info("Loading card database cache in the background...")
         from backend.api.scryfall_client import ScryfallClient
-        scryfall_client = ScryfallClient.get_instance()
-        logger.info("Card database cache ready")
+        threading.Thread(target=ScryfallClient.get_instance, daemon=True).start()
         
         # Create and run the GUI application
         root = tk.Tk()